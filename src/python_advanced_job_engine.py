@@ -4,14 +4,25 @@ Advanced Job Engine - Complete Job Search & Skill Development System
 Analyzes CV vs Job, Creates Learning Plans, Tracks Progress, Generates Applications
 """
 
+import copy
 import hashlib
+import heapq
 import json
+import os
 import re
+import sys
+import time
 import traceback
-from collections import defaultdict
+import weakref
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, FrozenSet, List, Mapping, Optional, Tuple, Union
 
 # PDF and DOCX reading libraries
 try:
@@ -28,6 +39,566 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
+# Faster JSON for the persisted data files (falls back to the stdlib json)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _thaw(obj: Any) -> Any:
+    """Inverse of _freeze: plain dicts and lists, for mutable per-instance copies"""
+    if isinstance(obj, Mapping):
+        return {k: _thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
+# ========== STATIC TABLES ==========
+# Built once at import time and shared read-only by every engine instance
+
+# Minimum interval between debounced rewrites of the same JSON file
+SAVE_DEBOUNCE_SECONDS: Final[float] = 10.0
+
+# Write buffer size for streamed JSON saves
+JSON_WRITE_BUFFER: Final[int] = 1 << 16
+
+# Parsed CVs / job descriptions kept per engine, keyed by content hash
+PARSE_CACHE_SIZE: Final[int] = 256
+
+# Jobs handed to a worker process at a time by analyze_jobs_batch
+BATCH_CHUNK_SIZE: Final[int] = 8
+
+# Scoring weights
+WEIGHTS: Final[Mapping[str, float]] = _freeze(
+    {
+        "required_skills": 0.35,
+        "preferred_skills": 0.15,
+        "experience": 0.20,
+        "education": 0.10,
+        "certifications": 0.05,
+        "keywords": 0.15,
+    }
+)
+
+# Test difficulty levels
+TEST_LEVELS: Final[Mapping[str, Mapping[str, int]]] = _freeze(
+    {
+        "beginner": {"questions": 10, "pass_score": 60},
+        "intermediate": {"questions": 15, "pass_score": 70},
+        "advanced": {"questions": 20, "pass_score": 80},
+    }
+)
+# Highest level a test score reaches: bisect the (ascending) pass scores;
+# rank 0 means below every level
+_PASS_SCORES: Final[Tuple[int, ...]] = tuple(level["pass_score"] for level in TEST_LEVELS.values())
+_LEVEL_BY_RANK: Final[Tuple[Optional[str], ...]] = (None, *TEST_LEVELS)
+
+# Quality gates (for reverse workflow)
+QUALITY_GATES: Final[Mapping[str, Mapping[str, Any]]] = _freeze(
+    {
+        "foundation": {"score": 65, "projects": 2, "tests_passed": "beginner"},
+        "competency": {"score": 80, "projects": 4, "tests_passed": "intermediate"},
+        "mastery": {"score": 90, "projects": 5, "tests_passed": "advanced"},
+        "application_ready": {"score": 90, "brand": True, "network": True},
+    }
+)
+
+# Stage the reverse workflow moves to once a quality gate is passed
+_NEXT_STAGE: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "foundation": "skill_building",
+        "competency": "mastery",
+        "mastery": "positioning",
+        "application_ready": "ready",
+    }
+)
+
+# Technical skill keywords per master-skillset subcategory
+SKILL_CATEGORIES: Final[Mapping[str, Tuple[str, ...]]] = _freeze(
+    {
+        "programming": ["python", "java", "javascript", "c++", "go", "rust", "scala", "r"],
+        "frameworks": ["pytorch", "tensorflow", "react", "django", "flask", "spring", "angular"],
+        "tools": ["docker", "kubernetes", "git", "jenkins", "terraform", "ansible"],
+        "databases": ["postgresql", "mongodb", "mysql", "redis", "cassandra"],
+        "cloud": ["aws", "azure", "gcp", "google cloud"],
+    }
+)
+
+# Reverse index: skill keyword -> subcategory
+_SUBCATEGORY_MAP: Final[Mapping[str, str]] = MappingProxyType(
+    {skill: category for category, skills in SKILL_CATEGORIES.items() for skill in skills}
+)
+
+# update_skillset's classification: the same index, except that "google cloud"
+# has always been filed under the "tools" fallback in the master skillset
+_SKILLSET_SUBCATEGORY: Final[Mapping[str, str]] = MappingProxyType(
+    {skill: category for skill, category in _SUBCATEGORY_MAP.items() if skill != "google cloud"}
+)
+
+# Word tokenizer used for single-word skill lookups
+_WORD_RE: Final[re.Pattern] = re.compile(r"\w+")
+
+# Keywords that are not a single word token ("c++", "google cloud"), each with
+# its compiled \bskill\b pattern
+_PHRASE_SKILLS: Final[Mapping[str, re.Pattern]] = MappingProxyType(
+    {
+        skill: re.compile(r"\b" + re.escape(skill) + r"\b")
+        for skill in _SUBCATEGORY_MAP
+        if not _WORD_RE.fullmatch(skill)
+    }
+)
+
+# Extraction patterns, compiled once at import instead of per call
+
+# Years-of-experience phrasings, fused into one pass. Each alternative sits in a
+# lookahead so overlapping phrases ("experience: 5 years in") are all counted, as
+# they were when every pattern ran its own findall; (?<!\d) keeps number-led
+# alternatives from also matching the tail of a longer number.
+_CV_EXPERIENCE_RE: Final[re.Pattern] = re.compile(
+    r"(?=(?<!\d)(\d+)\+?\s*years?\s+(?:of\s+)?experience"
+    r"|experience:\s*(\d+)"
+    r"|(?<!\d)(\d+)\s*years?\s+in)"
+)
+_JOB_EXPERIENCE_RE: Final[re.Pattern] = re.compile(
+    r"(?=(?<!\d)(\d+)\+?\s*years?\s+(?:of\s+)?experience"
+    r"|minimum\s+(\d+)\s+years?)"
+)
+# One sweep finds every degree keyword; the named group says which degree hit.
+# Keywords begin and end on word characters, so matches of different degrees
+# never overlap and finditer sees the same hits as one search per degree.
+_CV_DEGREE_RE: Final[re.Pattern] = re.compile(
+    r"\b(?:(?P<phd>phd|ph\.d|doctorate)"
+    r"|(?P<masters>master|msc|m\.s|ma|mba)"
+    r"|(?P<bachelors>bachelor|bsc|b\.s|ba))\b"
+)
+_JOB_DEGREE_RE: Final[re.Pattern] = re.compile(
+    r"\b(?:(?P<phd>phd|doctorate)"
+    r"|(?P<masters>master|graduate)"
+    r"|(?P<bachelors>bachelor|undergraduate))\b"
+)
+# Degree reported for each group, in output order
+_DEGREE_GROUPS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("phd", "PhD"),
+    ("masters", "Master's"),
+    ("bachelors", "Bachelor's"),
+)
+# Ordinal rank of each degree, for comparing CV education against requirements
+_DEGREE_LEVELS: Final[Mapping[str, int]] = MappingProxyType(
+    {"Bachelor's": 1, "Master's": 2, "PhD": 3}
+)
+_PROJECTS_RE: Final[re.Pattern] = re.compile(
+    r"projects?:?\s*\n(.*?)(?:\n\n|\Z)", re.IGNORECASE | re.DOTALL
+)
+_COMPANY_RE: Final[re.Pattern] = re.compile(r"company:\s*([^\n]+)", re.IGNORECASE)
+_REQUIRED_SECTION_RE: Final[re.Pattern] = re.compile(
+    r"(?:required|must have).*?:(.*?)(?:preferred|nice to have|\Z)", re.DOTALL
+)
+_PREFERRED_SECTION_RE: Final[re.Pattern] = re.compile(
+    r"(?:preferred|nice to have).*?:(.*?)(?:\Z)", re.DOTALL
+)
+_RESPONSIBILITIES_RE: Final[re.Pattern] = re.compile(
+    r"responsibilit(?:ies|y):?\s*(.*?)(?:requirements|qualifications|\Z)",
+    re.IGNORECASE | re.DOTALL,
+)
+# Single-word skills looked for in a job's required section
+_REQUIRED_SKILL_KEYWORDS: Final[Tuple[str, ...]] = (
+    "python",
+    "java",
+    "sql",
+    "aws",
+    "docker",
+    "kubernetes",
+    "pytorch",
+    "tensorflow",
+)
+# Plain substring keywords; the extractors test them with `in`, which is a
+# C-level scan per keyword and already cheaper than any regex sweep
+_CV_CERT_KEYWORDS: Final[Tuple[str, ...]] = (
+    "aws",
+    "azure",
+    "gcp",
+    "certified",
+    "certification",
+    "cka",
+    "ckad",
+)
+_JOB_CERT_KEYWORDS: Final[Tuple[str, ...]] = ("aws certified", "azure certified", "cka", "ckad")
+_SOFT_SKILLS: Final[Tuple[str, ...]] = (
+    "leadership",
+    "communication",
+    "teamwork",
+    "problem solving",
+)
+_IMPORTANT_KEYWORDS: Final[Tuple[str, ...]] = (
+    "machine learning",
+    "deep learning",
+    "mlops",
+    "data science",
+    "cloud",
+)
+
+# Learning resources database
+LEARNING_RESOURCES: Final[Mapping[str, Mapping[str, Tuple[str, ...]]]] = _freeze(
+    {
+        "python": {
+            "study": [
+                "Python.org Documentation",
+                "Real Python Tutorials",
+                "Python Crash Course Book",
+            ],
+            "practice": ["LeetCode Python", "HackerRank Python", "Codewars Python"],
+            "courses": [
+                "Python for Everybody (Coursera)",
+                "Complete Python Bootcamp (Udemy)",
+                "MIT 6.0001",
+            ],
+        },
+        "machine learning": {
+            "study": ["Hands-On ML Book", "ML Crash Course (Google)", "Scikit-learn Docs"],
+            "practice": ["Kaggle Competitions", "ML Project Ideas", "Scikit-learn Examples"],
+            "courses": [
+                "Machine Learning (Coursera)",
+                "Fast.ai",
+                "Deep Learning Specialization",
+            ],
+        },
+        "pytorch": {
+            "study": [
+                "PyTorch Documentation",
+                "PyTorch Tutorials",
+                "Deep Learning with PyTorch Book",
+            ],
+            "practice": ["PyTorch Examples Repo", "Papers with Code", "Kaggle PyTorch Kernels"],
+            "courses": [
+                "Deep Learning with PyTorch (Udacity)",
+                "PyTorch for Deep Learning (Udemy)",
+            ],
+        },
+        "aws": {
+            "study": ["AWS Documentation", "AWS Well-Architected", "AWS Whitepapers"],
+            "practice": ["AWS Free Tier Projects", "AWS Hands-On Labs", "LocalStack"],
+            "courses": [
+                "AWS Solutions Architect (Udemy)",
+                "A Cloud Guru AWS",
+                "AWS Training Portal",
+            ],
+        },
+        "docker": {
+            "study": [
+                "Docker Documentation",
+                "Docker Deep Dive Book",
+                "Docker Getting Started",
+            ],
+            "practice": ["Docker Labs", "Dockerize Projects", "Docker Compose Examples"],
+            "courses": ["Docker Mastery (Udemy)", "Docker and Kubernetes (Udemy)"],
+        },
+        "kubernetes": {
+            "study": ["Kubernetes Docs", "Kubernetes Up & Running Book", "K8s Patterns"],
+            "practice": ["Minikube Labs", "K8s the Hard Way", "Kubernetes Examples"],
+            "courses": ["CKA Certification Prep", "Kubernetes for Developers", "K8s Mastery"],
+        },
+        "sql": {
+            "study": ["W3Schools SQL", "PostgreSQL Tutorial", "SQL Performance Explained"],
+            "practice": ["SQLZoo", "LeetCode SQL", "HackerRank SQL"],
+            "courses": ["Complete SQL Bootcamp", "SQL for Data Science", "Advanced SQL (Mode)"],
+        },
+        "javascript": {
+            "study": ["MDN Web Docs", "JavaScript.info", "Eloquent JavaScript"],
+            "practice": ["JavaScript30", "FreeCodeCamp JS", "Codewars JS"],
+            "courses": [
+                "JavaScript Complete Course",
+                "Modern JavaScript (Udemy)",
+                "JS Algorithms",
+            ],
+        },
+        "nlp": {
+            "study": [
+                "NLP with Python Book",
+                "Hugging Face Docs",
+                "Speech & Language Processing",
+            ],
+            "practice": ["Kaggle NLP Challenges", "NLP Projects", "Hugging Face Tasks"],
+            "courses": ["NLP Specialization (Coursera)", "Fast.ai NLP", "Advanced NLP (Udemy)"],
+        },
+        "default": {
+            "study": ["Official Documentation", "Technical Blogs", "Research Papers"],
+            "practice": ["GitHub Projects", "Coding Challenges", "Real-world Applications"],
+            "courses": ["Coursera Courses", "Udemy Courses", "YouTube Tutorials"],
+        },
+    }
+)
+
+# Sample question templates per test level; "{skill}" is filled in per skill
+_BEGINNER_QUESTIONS: Final[Mapping[str, Tuple[Mapping[str, str], ...]]] = _freeze(
+    {
+        "python": [
+            {
+                "q": "What is the difference between a list and tuple in Python?",
+                "type": "concept",
+            },
+            {"q": "Write a function to reverse a string", "type": "coding"},
+            {"q": "Explain what a dictionary is and give an example", "type": "concept"},
+            {"q": "How do you handle exceptions in Python?", "type": "concept"},
+            {"q": "Write a program to find the sum of numbers in a list", "type": "coding"},
+        ],
+        "sql": [
+            {"q": "What is the difference between WHERE and HAVING?", "type": "concept"},
+            {"q": "Write a query to select all users with age > 25", "type": "coding"},
+            {"q": "Explain what a JOIN is", "type": "concept"},
+            {"q": "How do you sort results in ascending order?", "type": "concept"},
+            {"q": "Write a query to count records in a table", "type": "coding"},
+        ],
+        "default": [
+            {"q": "What are the basic concepts of {skill}?", "type": "concept"},
+            {"q": "How do you get started with {skill}?", "type": "concept"},
+            {"q": "What are common use cases for {skill}?", "type": "concept"},
+            {"q": "Solve a simple problem using {skill}", "type": "coding"},
+            {"q": "Explain key terminology in {skill}", "type": "concept"},
+        ],
+    }
+)
+
+_INTERMEDIATE_QUESTIONS: Final[Tuple[Mapping[str, str], ...]] = _freeze(
+    [
+        {"q": "Design a solution for [problem] using {skill}", "type": "design"},
+        {"q": "What are the performance considerations when using {skill}?", "type": "concept"},
+        {"q": "How do you debug issues in {skill}?", "type": "practical"},
+        {"q": "Implement [complex feature] using {skill}", "type": "coding"},
+        {"q": "Compare {skill} with alternative solutions", "type": "analysis"},
+    ]
+)
+
+_ADVANCED_QUESTIONS: Final[Tuple[Mapping[str, str], ...]] = _freeze(
+    [
+        {"q": "Design a scalable system using {skill}", "type": "system_design"},
+        {"q": "How would you optimize {skill} for production?", "type": "optimization"},
+        {"q": "Explain advanced architectural patterns with {skill}", "type": "architecture"},
+        {"q": "Solve a complex real-world problem with {skill}", "type": "coding"},
+        {"q": "What are the trade-offs when choosing {skill}?", "type": "analysis"},
+    ]
+)
+
+# Professional branding checklist shown by stage_positioning
+POSITIONING_CHECKLIST: Final[Mapping[str, Mapping[str, Any]]] = _freeze(
+    {
+        "linkedin_profile": {
+            "priority": "CRITICAL",
+            "tasks": [
+                "Add all new skills to Skills section",
+                "Showcase 5+ portfolio projects in Featured section",
+                "Write detailed experience descriptions with metrics",
+                "Professional photo and compelling headline",
+                "Get 3+ recommendations from colleagues/mentors",
+                "Join relevant groups and engage weekly",
+                "Share technical content regularly",
+            ],
+        },
+        "github_portfolio": {
+            "priority": "CRITICAL",
+            "tasks": [
+                "Organize repositories professionally with topics/tags",
+                "Comprehensive READMEs for all major projects",
+                "Pin best 6 projects to profile",
+                "Active contribution graph (green squares daily)",
+                "Profile README with portfolio showcase and bio",
+                "Clean up code, add comments and documentation",
+                "Include live demos or screenshots",
+            ],
+        },
+        "technical_content": {
+            "priority": "HIGH",
+            "tasks": [
+                "Write 3-5 technical blog posts (Medium, Dev.to)",
+                "Create tutorial or guide in your specialty",
+                "Document your learning journey publicly",
+                "Share insights on LinkedIn 2-3x per week",
+                "Answer questions on Stack Overflow",
+                "Contribute to technical discussions",
+            ],
+        },
+        "personal_website": {
+            "priority": "MEDIUM",
+            "tasks": [
+                "Portfolio showcase page with project cards",
+                "About/story section telling your journey",
+                "Contact information and social links",
+                "Resume download (PDF)",
+                "Blog or articles section (optional)",
+                "Mobile-responsive design",
+                "SEO optimization",
+            ],
+        },
+        "networking": {
+            "priority": "HIGH",
+            "tasks": [
+                "Connect with 20+ relevant professionals on LinkedIn",
+                "Join 3+ industry communities/Slack groups",
+                "Attend 2+ virtual meetups or webinars monthly",
+                "Engage with target company employees",
+                "Request 5+ informational interviews",
+                "Follow up and maintain relationships",
+                "Offer value before asking for help",
+            ],
+        },
+    }
+)
+
+# Improvement strategy phases; phase 1 objectives come from the analysis gaps
+_STRATEGY_PHASES: Final[Tuple[Mapping[str, Any], ...]] = _freeze(
+    [
+        {
+            "phase": 1,
+            "name": "Foundation Building",
+            "duration": "4 weeks",
+            "focus": "Critical required skills",
+            "objectives": [],  # filled in per analysis
+            "activities": [
+                "Complete foundational courses",
+                "Study documentation and tutorials",
+                "Build 2-3 small projects",
+            ],
+            "success_criteria": [
+                "Pass beginner level tests",
+                "Complete 3 hands-on projects",
+                "Demonstrate basic proficiency",
+            ],
+            "expected_score_increase": 15,
+        },
+        {
+            "phase": 2,
+            "name": "Skill Development",
+            "duration": "4 weeks",
+            "focus": "Advanced skills and practice",
+            "objectives": [
+                "Deepen understanding of core technologies",
+                "Build portfolio projects",
+                "Gain practical experience",
+            ],
+            "activities": [
+                "Complete intermediate courses",
+                "Contribute to open source",
+                "Build 2-3 medium complexity projects",
+                "Practice coding challenges daily",
+            ],
+            "success_criteria": [
+                "Pass intermediate level tests",
+                "Complete 3 portfolio projects",
+                "Demonstrate intermediate proficiency",
+            ],
+            "expected_score_increase": 15,
+        },
+        {
+            "phase": 3,
+            "name": "Mastery & Job Application",
+            "duration": "4 weeks",
+            "focus": "Advanced topics and job preparation",
+            "objectives": [
+                "Master all required skills",
+                "Build comprehensive portfolio",
+                "Prepare for interviews",
+            ],
+            "activities": [
+                "Complete advanced courses",
+                "Build 1-2 advanced projects",
+                "Practice system design",
+                "Mock interviews",
+                "Update CV and LinkedIn",
+            ],
+            "success_criteria": [
+                "Pass advanced level tests",
+                "Have 5+ strong portfolio projects",
+                "Ready for interviews",
+            ],
+            "expected_score_increase": 10,
+        },
+    ]
+)
+
+# 12-week schedule: three 4-week blocks of (focus, activities); the first
+# focus names the plan's top study skill
+_WEEKS_PER_BLOCK: Final[int] = 4
+_WEEK_BLOCKS: Final[Tuple[Tuple[str, Tuple[str, ...]], ...]] = (
+    (
+        "Foundation: {skill}",
+        ("Complete foundational course", "Daily practice (1hr)", "Build mini-project"),
+    ),
+    (
+        "Skill Development & Practice",
+        ("Advanced course modules", "Coding challenges", "Medium project"),
+    ),
+    (
+        "Advanced Topics & Portfolio Building",
+        ("Build portfolio project", "Mock interviews", "CV updates"),
+    ),
+)
+
+# Printable titles ("application_ready" -> "Application Ready") for the fixed
+# keys the dashboard, positioning checklist and report print in loops
+_DISPLAY_TITLES: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        key: key.replace("_", " ").title()
+        for keys in (POSITIONING_CHECKLIST, QUALITY_GATES, WEIGHTS)
+        for key in keys
+    }
+)
+
+
+def _render_positioning_guide() -> str:
+    """Render the static body of stage_positioning (checklist, tracking snippet, tips)"""
+    lines: List[str] = ["\n📋 Professional Branding Checklist:\n"]
+    for area, info in POSITIONING_CHECKLIST.items():
+        lines.append(f"📌 {_DISPLAY_TITLES[area]} [{info['priority']}]:")
+        lines.extend(f"   ☐ {task}" for task in info["tasks"])
+        lines.append("")
+
+    lines += [
+        "=" * 80,
+        "TRACKING YOUR POSITIONING PROGRESS:",
+        "=" * 80,
+        """
+# When LinkedIn is polished:
+engine.state['linkedin_ready'] = True
+
+# When GitHub portfolio is professional:
+engine.state['github_ready'] = True
+
+# When overall brand is ready:
+engine.state['brand_ready'] = True
+
+# When network is established:
+engine.state['network_ready'] = True
+
+# Save state:
+engine._save_json(engine.state_file, engine.state)
+
+# Check if application ready:
+engine.check_quality_gates()
+""",
+        "\n💡 PRO TIPS:",
+        "   • Quality over quantity - 5 great projects > 20 mediocre ones",
+        "   • Consistency matters - regular activity shows dedication",
+        "   • Engagement beats broadcasting - comment, discuss, help others",
+        "   • Tell your story - people connect with journeys, not just skills",
+        "   • Be authentic - genuine passion shines through",
+    ]
+    return "\n".join(lines)
+
+
+_POSITIONING_GUIDE: Final[str] = _render_positioning_guide()
+
 
 class AdvancedJobEngine:
     def __init__(self, data_dir: str = "job_search_data"):
@@ -42,112 +613,200 @@ class AdvancedJobEngine:
         self.sprints_file = self.data_dir / "sprint_history.json"
         self.state_file = self.data_dir / "workflow_state.json"
 
-        # Load data
-        self.master_skillset = self._load_json(self.skillset_file, self._init_skillset())
-        self.learning_progress = self._load_json(self.progress_file, [])
-        self.analyzed_jobs = self._load_json(self.jobs_file, [])
-        self.skill_tests = self._load_json(self.tests_file, [])
-        self.sprint_history = self._load_json(self.sprints_file, [])
-        self.state = self._load_json(self.state_file, self._init_state())
-
-        # Scoring weights
-        self.WEIGHTS: Dict[str, float] = {
-            "required_skills": 0.35,
-            "preferred_skills": 0.15,
-            "experience": 0.20,
-            "education": 0.10,
-            "certifications": 0.05,
-            "keywords": 0.15,
-        }
+        # Machine-managed files are written without indentation
+        self._compact_files: frozenset = frozenset(
+            {self.state_file, self.tests_file, self.sprints_file}
+        )
 
-        # Learning resources database
-        self.LEARNING_RESOURCES = self._init_learning_resources()
+        # Data files are loaded lazily on first access (see properties below)
 
-        # Test difficulty levels
-        self.TEST_LEVELS: Dict[str, Dict[str, int]] = {
-            "beginner": {"questions": 10, "pass_score": 60},
-            "intermediate": {"questions": 15, "pass_score": 70},
-            "advanced": {"questions": 20, "pass_score": 80},
-        }
+        # Debounced writes: pending data per file and last write time per file
+        self._dirty: Dict[Path, Any] = {}
+        self._last_flush: Dict[Path, float] = {}
+        # Whatever is still pending is written when the engine is garbage-collected
+        # or at interpreter exit; the finalizer holds no reference to the engine
+        self._finalizer = weakref.finalize(
+            self, AdvancedJobEngine._write_pending, self._dirty, self._compact_files
+        )
 
-        # Quality gates (for reverse workflow)
-        self.QUALITY_GATES: Dict[str, Dict[str, Any]] = {
-            "foundation": {"score": 65, "projects": 2, "tests_passed": "beginner"},
-            "competency": {"score": 80, "projects": 4, "tests_passed": "intermediate"},
-            "mastery": {"score": 90, "projects": 5, "tests_passed": "advanced"},
-            "application_ready": {"score": 90, "brand": True, "network": True},
+        # Extraction results per CV / job text (see _cached_parse)
+        self._cv_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._job_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+        # Per-instance copies of the static tables (see module level); callers
+        # may customise them, e.g. engine.WEIGHTS["keywords"] = 0.3
+        self.WEIGHTS: Dict[str, float] = _thaw(WEIGHTS)
+        self.LEARNING_RESOURCES: Dict[str, Dict[str, List[str]]] = _thaw(LEARNING_RESOURCES)
+        self.TEST_LEVELS: Dict[str, Dict[str, int]] = _thaw(TEST_LEVELS)
+        self.QUALITY_GATES: Dict[str, Dict[str, Any]] = _thaw(QUALITY_GATES)
+
+    # ========== PERSISTED DATA (loaded on first access) ==========
+
+    @cached_property
+    def master_skillset(self) -> Dict[str, Any]:
+        return self._load_json(self.skillset_file, self._init_skillset())
+
+    @cached_property
+    def _skillset_index(self) -> Dict[str, set]:
+        """Membership sets mirroring each master skillset list (exact strings, as stored)"""
+        skillset = self.master_skillset
+        index: Dict[str, set] = {
+            subcategory: set(skills) for subcategory, skills in skillset["technical_skills"].items()
         }
+        index["certifications"] = set(skillset["certifications"])
+        index["soft_skills"] = set(skillset["soft_skills"])
+        return index
+
+    @cached_property
+    def learning_progress(self) -> Any:
+        return self._load_json(self.progress_file, [])
+
+    @cached_property
+    def analyzed_jobs(self) -> List[Dict[str, Any]]:
+        return self._load_json(self.jobs_file, [])
+
+    @cached_property
+    def _analyses_by_id(self) -> Dict[str, Dict[str, Any]]:
+        """job_id -> first analysis saved under it, kept in step with analyzed_jobs"""
+        index: Dict[str, Dict[str, Any]] = {}
+        for analysis in self.analyzed_jobs:
+            if isinstance(analysis, dict) and "job_id" in analysis:
+                index.setdefault(analysis["job_id"], analysis)
+        return index
+
+    @cached_property
+    def skill_tests(self) -> Any:
+        return self._load_json(self.tests_file, [])
+
+    @cached_property
+    def sprint_history(self) -> List[Dict[str, Any]]:
+        return self._load_json(self.sprints_file, [])
+
+    @cached_property
+    def state(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = self._load_json(self.state_file, self._init_state())
+
+        # Membership-checked state is held as sets in memory (lists on disk)
+        state["skills_mastered"] = set(state.get("skills_mastered", []))
+        state["tests_passed"] = {
+            skill: set(levels) for skill, levels in state.get("tests_passed", {}).items()
+        }
+        return state
 
     def _load_json(self, filepath: Path, default: Any) -> Any:
         if filepath.exists():
+            if ORJSON_AVAILABLE:
+                return orjson.loads(filepath.read_bytes())
             with open(filepath, "r", encoding="utf-8") as f:
                 return json.load(f)
         return default
 
     def _save_json(self, filepath: Path, data: Any) -> None:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-            
-    def read_document(self, file_path: str) -> str:
         """
-        Read document from file (supports .txt, .pdf, .docx)
+        Write JSON atomically: dump to a sibling temp file, then rename over the target
 
-        Improvements:
-        • Handles empty or None file paths
-        • Falls back to defaults (data/my_cv.txt, data/target_job.txt)
-        • Validates extension and existence
-        • Provides clear user feedback
+        Uses orjson when installed; otherwise the stdlib encoder streams the
+        document through a 64 KiB buffer rather than building one string.
+        Files in self._compact_files are written compact; everything else
+        (skillset, letters, exports) stays indented for reading by hand.
         """
-        # Detect empty input and apply fallbacks
-        if not file_path or not str(file_path).strip():
-            default_cv = Path("data/my_cv.txt")
-            default_job = Path("data/target_job.txt")
-
-        if default_cv.exists():
-            print("⚠️ No CV path provided — using default: data/my_cv.txt")
-            file_path = str(default_cv)
-        elif default_job.exists():
-            print("⚠️ No Job path provided — using default: data/target_job.txt")
-            file_path = str(default_job)
-        else:
-            raise ValueError(
-                "❌ File path cannot be empty.\n"
-                "Please provide a valid file path (e.g., 'resume.txt', 'cv.pdf', 'job.docx')\n"
-                "Hint: Place your CV in 'data/my_cv.txt' and job description in 'data/target_job.txt'."
-            )
+        self._write_json(filepath, data, filepath in self._compact_files)
 
-        path = Path(file_path)
+    @staticmethod
+    def _write_json(filepath: Path, data: Any, compact: bool) -> None:
+        """_save_json without the engine: usable from the finalizer"""
+        tmp_path = filepath.with_name(filepath.name + ".tmp")
+        try:
+            if ORJSON_AVAILABLE:
+                option = orjson.OPT_NON_STR_KEYS
+                if not compact:
+                    option |= orjson.OPT_INDENT_2
+                tmp_path.write_bytes(
+                    orjson.dumps(data, default=AdvancedJobEngine._json_default, option=option)
+                )
+            else:
+                if compact:
+                    layout: Dict[str, Any] = {"separators": (",", ":")}
+                else:
+                    layout = {"indent": 2}
+                with open(tmp_path, "w", encoding="utf-8", buffering=JSON_WRITE_BUFFER) as f:
+                    json.dump(
+                        data,
+                        f,
+                        ensure_ascii=False,
+                        default=AdvancedJobEngine._json_default,
+                        **layout,
+                    )
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _maybe_flush(self, filepath: Path, data: Any, force: bool = False) -> None:
+        """
+        Save data unless the same file was written within SAVE_DEBOUNCE_SECONDS
 
-        if not path.exists():
-            raise FileNotFoundError(f"❌ File not found: {path.resolve()}")
+        Deferred data stays pending until the next forced write, flush_state(),
+        or the engine's finalizer (garbage collection or interpreter exit), so
+        bursts of updates cost a single rewrite.
+        """
+        self._dirty[filepath] = data
+        now = time.monotonic()
+        last = self._last_flush.get(filepath)
+        if force or last is None or now - last >= SAVE_DEBOUNCE_SECONDS:
+            self._save_json(filepath, data)
+            del self._dirty[filepath]
+            self._last_flush[filepath] = now
+
+    def flush_state(self) -> None:
+        """Write all pending debounced changes to disk"""
+        while self._dirty:
+            filepath, data = self._dirty.popitem()
+            self._save_json(filepath, data)
+            self._last_flush[filepath] = time.monotonic()
+
+    @staticmethod
+    def _write_pending(dirty: Dict[Path, Any], compact_files: FrozenSet[Path]) -> None:
+        """Finalizer: write the debounced payloads an engine left pending"""
+        while dirty:
+            filepath, data = dirty.popitem()
+            AdvancedJobEngine._write_json(filepath, data, filepath in compact_files)
+
+    @staticmethod
+    def _json_default(obj: Any) -> Any:
+        """Serialize in-memory sets as sorted lists"""
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _read_document_cached(path_str: str, mtime_ns: int, size: int) -> str:
+        """
+        Read and decode a document, memoized on (resolved path, mtime, size)
 
+        Re-analyzing the same CV against many jobs then reads it only once;
+        editing the file changes its mtime/size and invalidates the entry.
+        """
+        path = Path(path_str)
         ext = path.suffix.lower()
-        supported = [".txt", ".pdf", ".docx"]
-
-        if ext not in supported:
-            raise ValueError(
-                f"❌ Unsupported file format: {ext}\n"
-                f"Supported formats: {', '.join(supported)}"
-            )
-
-        print(f"📂 Reading document: {path.resolve()}")
-
         if ext == ".txt":
-            return self._read_txt(path)
+            return AdvancedJobEngine._read_txt(path)
         elif ext == ".pdf":
-            return self._read_pdf(path)
+            return AdvancedJobEngine._read_pdf(path)
         elif ext == ".docx":
-            return self._read_docx(path)
+            return AdvancedJobEngine._read_docx(path)
         else:
             raise ValueError(f"Unexpected file type: {ext}")
-    
-    def _read_txt(self, path: Path) -> str:
+
+    @staticmethod
+    def _read_txt(path: Path) -> str:
         """Read plain text file"""
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
             return f.read()
 
-    def _read_pdf(self, path: Path) -> str:
+    @staticmethod
+    def _read_pdf(path: Path) -> str:
         """Read PDF file"""
         if not PDF_AVAILABLE:
             raise ImportError(
@@ -155,16 +814,15 @@ class AdvancedJobEngine:
             )
 
         try:
+            # Extract and join the pages while the file is still open
             with open(path, "rb") as f:
                 pdf_reader = PyPDF2.PdfReader(f)
-                text: List[str] = []
-                for page in pdf_reader.pages:
-                    text.append(page.extract_text())
-            return "\n".join(text)
+                return "\n".join(page.extract_text() for page in pdf_reader.pages)
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
 
-    def _read_docx(self, path: Path) -> str:
+    @staticmethod
+    def _read_docx(path: Path) -> str:
         """Read DOCX file"""
         if not DOCX_AVAILABLE:
             raise ImportError(
@@ -174,19 +832,14 @@ class AdvancedJobEngine:
 
         try:
             doc = Document(str(path))
-            text: List[str] = []
-
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                text.append(paragraph.text)
-
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text.append(cell.text)
 
-            return "\n".join(text)
+            # Paragraphs first, then table cells, joined in a single pass
+            return "\n".join(
+                chain(
+                    (paragraph.text for paragraph in doc.paragraphs),
+                    (cell.text for table in doc.tables for row in table.rows for cell in row.cells),
+                )
+            )
         except Exception as e:
             raise Exception(f"Error reading DOCX: {str(e)}")
 
@@ -207,96 +860,6 @@ class AdvancedJobEngine:
             "last_updated": datetime.now().isoformat(),
         }
 
-    def _init_learning_resources(self) -> Dict[str, Dict[str, List[str]]]:
-        """Initialize comprehensive learning resources database"""
-        return {
-            "python": {
-                "study": [
-                    "Python.org Documentation",
-                    "Real Python Tutorials",
-                    "Python Crash Course Book",
-                ],
-                "practice": ["LeetCode Python", "HackerRank Python", "Codewars Python"],
-                "courses": [
-                    "Python for Everybody (Coursera)",
-                    "Complete Python Bootcamp (Udemy)",
-                    "MIT 6.0001",
-                ],
-            },
-            "machine learning": {
-                "study": ["Hands-On ML Book", "ML Crash Course (Google)", "Scikit-learn Docs"],
-                "practice": ["Kaggle Competitions", "ML Project Ideas", "Scikit-learn Examples"],
-                "courses": [
-                    "Machine Learning (Coursera)",
-                    "Fast.ai",
-                    "Deep Learning Specialization",
-                ],
-            },
-            "pytorch": {
-                "study": [
-                    "PyTorch Documentation",
-                    "PyTorch Tutorials",
-                    "Deep Learning with PyTorch Book",
-                ],
-                "practice": ["PyTorch Examples Repo", "Papers with Code", "Kaggle PyTorch Kernels"],
-                "courses": [
-                    "Deep Learning with PyTorch (Udacity)",
-                    "PyTorch for Deep Learning (Udemy)",
-                ],
-            },
-            "aws": {
-                "study": ["AWS Documentation", "AWS Well-Architected", "AWS Whitepapers"],
-                "practice": ["AWS Free Tier Projects", "AWS Hands-On Labs", "LocalStack"],
-                "courses": [
-                    "AWS Solutions Architect (Udemy)",
-                    "A Cloud Guru AWS",
-                    "AWS Training Portal",
-                ],
-            },
-            "docker": {
-                "study": [
-                    "Docker Documentation",
-                    "Docker Deep Dive Book",
-                    "Docker Getting Started",
-                ],
-                "practice": ["Docker Labs", "Dockerize Projects", "Docker Compose Examples"],
-                "courses": ["Docker Mastery (Udemy)", "Docker and Kubernetes (Udemy)"],
-            },
-            "kubernetes": {
-                "study": ["Kubernetes Docs", "Kubernetes Up & Running Book", "K8s Patterns"],
-                "practice": ["Minikube Labs", "K8s the Hard Way", "Kubernetes Examples"],
-                "courses": ["CKA Certification Prep", "Kubernetes for Developers", "K8s Mastery"],
-            },
-            "sql": {
-                "study": ["W3Schools SQL", "PostgreSQL Tutorial", "SQL Performance Explained"],
-                "practice": ["SQLZoo", "LeetCode SQL", "HackerRank SQL"],
-                "courses": ["Complete SQL Bootcamp", "SQL for Data Science", "Advanced SQL (Mode)"],
-            },
-            "javascript": {
-                "study": ["MDN Web Docs", "JavaScript.info", "Eloquent JavaScript"],
-                "practice": ["JavaScript30", "FreeCodeCamp JS", "Codewars JS"],
-                "courses": [
-                    "JavaScript Complete Course",
-                    "Modern JavaScript (Udemy)",
-                    "JS Algorithms",
-                ],
-            },
-            "nlp": {
-                "study": [
-                    "NLP with Python Book",
-                    "Hugging Face Docs",
-                    "Speech & Language Processing",
-                ],
-                "practice": ["Kaggle NLP Challenges", "NLP Projects", "Hugging Face Tasks"],
-                "courses": ["NLP Specialization (Coursera)", "Fast.ai NLP", "Advanced NLP (Udemy)"],
-            },
-            "default": {
-                "study": ["Official Documentation", "Technical Blogs", "Research Papers"],
-                "practice": ["GitHub Projects", "Coding Challenges", "Real-world Applications"],
-                "courses": ["Coursera Courses", "Udemy Courses", "YouTube Tutorials"],
-            },
-        }
-
     def _init_state(self) -> Dict[str, Any]:
         """Initialize workflow state"""
         return {
@@ -306,9 +869,9 @@ class AdvancedJobEngine:
             "current_score": 0,
             "target_score": 90,
             "current_sprint": 0,
-            "skills_mastered": [],
+            "skills_mastered": set(),
             "projects_completed": [],
-            "tests_passed": {},  # Track test levels passed per skill
+            "tests_passed": {},  # Track test levels passed per skill (skill -> set of levels)
             "quality_gates_passed": [],
             "brand_ready": False,
             "network_ready": False,
@@ -319,14 +882,20 @@ class AdvancedJobEngine:
 
     def parse_cv(self, cv_text: str) -> Dict[str, Any]:
         """Extract structured information from CV"""
+        return self._cached_parse(self._cv_cache, cv_text, self._parse_cv_fields)
+
+    def _parse_cv_fields(self, cv_text: str) -> Dict[str, Any]:
+        """Run every CV extractor (uncached)"""
+        # Lowercased once and shared by every case-insensitive extractor
+        cv_lower: str = cv_text.lower()
         return {
             "raw_text": cv_text,
-            "skills": self._extract_all_skills(cv_text),
-            "experience_years": self._extract_experience(cv_text),
-            "education": self._extract_education(cv_text),
-            "certifications": self._extract_certifications(cv_text),
+            "skills": self._extract_all_skills(cv_lower),
+            "experience_years": self._extract_experience(cv_lower),
+            "education": self._extract_education(cv_lower),
+            "certifications": self._extract_certifications(cv_lower),
             "projects": self._extract_projects(cv_text),
-            "soft_skills": self._extract_soft_skills(cv_text),
+            "soft_skills": self._extract_soft_skills(cv_lower),
         }
 
     def parse_job(self, job_text: str, title: str = "", company: str = "") -> Dict[str, Any]:
@@ -336,18 +905,50 @@ class AdvancedJobEngine:
             "title": title or self._extract_title(job_text),
             "company": company or self._extract_company(job_text),
             "raw_text": job_text,
-            "required_skills": self._extract_required_skills(job_text),
-            "preferred_skills": self._extract_preferred_skills(job_text),
-            "required_experience": self._extract_required_experience(job_text),
-            "education_required": self._extract_education_req(job_text),
-            "certifications_required": self._extract_cert_req(job_text),
-            "keywords": self._extract_keywords(job_text),
-            "responsibilities": self._extract_responsibilities(job_text),
+            **self._cached_parse(self._job_cache, job_text, self._parse_job_fields),
             "analyzed_date": datetime.now().isoformat(),
         }
 
+    def _parse_job_fields(self, job_text: str) -> Dict[str, Any]:
+        """Run the text-only job extractors (uncached)"""
+        # Lowercased once and shared by every case-insensitive extractor
+        job_lower: str = job_text.lower()
+        return {
+            "required_skills": self._extract_required_skills(job_lower),
+            "preferred_skills": self._extract_preferred_skills(job_lower),
+            "required_experience": self._extract_required_experience(job_lower),
+            "education_required": self._extract_education_req(job_lower),
+            "certifications_required": self._extract_cert_req(job_lower),
+            "keywords": self._extract_keywords(job_lower),
+            "responsibilities": self._extract_responsibilities(job_text),
+        }
+
+    @staticmethod
+    def _cached_parse(
+        cache: "OrderedDict[bytes, Dict[str, Any]]",
+        text: str,
+        parse: Callable[[str], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Return parse(text), reusing the result for text seen before
 
-    def read_document(self, file_path: str) -> str:
+        Batch runs score one CV against many jobs (and one job against many
+        CVs), so each distinct text is parsed once. The cache is an LRU of
+        PARSE_CACHE_SIZE entries keyed by a BLAKE2 digest of the text. Callers
+        get a deep copy, so editing a returned result never alters the cache.
+        """
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = parse(text)
+            if len(cache) > PARSE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return copy.deepcopy(result)
+
+
+    def read_document(self, file_path: Union[str, Path]) -> str:
         """
         Read document from file (supports .txt, .pdf, .docx)
 
@@ -356,6 +957,16 @@ class AdvancedJobEngine:
         • Falls back to defaults (data/my_cv.txt, data/target_job.txt)
         • Checks existence and valid file type
         • Prints clear messages for every step
+        • Reuses the decoded text while the file is unchanged
+        """
+        return self._read_document_cached(*self._locate_document(file_path))
+
+    def _locate_document(self, file_path: Union[str, Path]) -> Tuple[str, int, int]:
+        """
+        Validate a document path and announce it
+
+        Returns:
+            (resolved path, mtime_ns, size): the cache key for _read_document_cached
         """
         # Define default file paths at the top (avoids UnboundLocalError)
         default_cv = Path("data/my_cv.txt")
@@ -392,17 +1003,12 @@ class AdvancedJobEngine:
                 f"Supported formats: {', '.join(supported_formats)}"
             )
 
-        print(f"📂 Reading document: {path.resolve()}")
+        resolved = path.resolve()
+        print(f"📂 Reading document: {resolved}")
 
-        # Dispatch to appropriate reader
-        if ext == ".txt":
-            return self._read_txt(path)
-        elif ext == ".pdf":
-            return self._read_pdf(path)
-        elif ext == ".docx":
-            return self._read_docx(path)
-        else:
-            raise ValueError(f"Unexpected file type: {ext}")
+        # Readers are cached per file version
+        stat = resolved.stat()
+        return str(resolved), stat.st_mtime_ns, stat.st_size
 
     
     def analyze_from_files(self, cv_file: str = "", job_file: str = "",
@@ -434,14 +1040,20 @@ class AdvancedJobEngine:
             else:
                 raise ValueError("❌ No Job file provided and no default found in data/target_job.txt")
 
-        # Proceed with standard workflow
+        # Proceed with standard workflow. Paths are validated here, in order;
+        # the two extractions (PDF/DOCX decoding, file I/O) then overlap
         print(f"📄 Reading CV from: {cv_file}")
-        cv_text: str = self.read_document(cv_file)
-        print(f"   ✅ Extracted {len(cv_text)} characters")
-
+        cv_doc: Tuple[str, int, int] = self._locate_document(cv_file)
         print(f"📄 Reading job description from: {job_file}")
-        job_text: str = self.read_document(job_file)
-        print(f"   ✅ Extracted {len(job_text)} characters")
+        job_doc: Tuple[str, int, int] = self._locate_document(job_file)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            cv_future = pool.submit(self._read_document_cached, *cv_doc)
+            job_future = pool.submit(self._read_document_cached, *job_doc)
+            cv_text: str = cv_future.result()
+            job_text: str = job_future.result()
+        print(f"   ✅ Extracted {len(cv_text)} characters from CV")
+        print(f"   ✅ Extracted {len(job_text)} characters from job description")
 
         print("\n📊 Analyzing job match...")
         return self.analyze_job_complete(cv_text, job_text, job_title, company)
@@ -452,14 +1064,66 @@ class AdvancedJobEngine:
         """
         STEP 1 & 2: Complete job analysis with scoring
         """
+        analysis: Dict[str, Any] = self._build_analysis(cv_text, job_text, job_title, company)
+
+        # Save analysis
+        self.analyzed_jobs.append(analysis)
+        self._analyses_by_id.setdefault(analysis["job_id"], analysis)
+        # Debounced: a run of single analyses rewrites the growing file once
+        self._maybe_flush(self.jobs_file, self.analyzed_jobs)
+
+        return analysis
+
+    def analyze_jobs_batch(
+        self,
+        cv_text: str,
+        jobs: List[Tuple[str, str, str]],
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze one CV against many jobs, spreading the work over processes
+
+        Args:
+            cv_text: CV to match
+            jobs: (job_text, job_title, company) tuples
+            max_workers: Process count (default: CPU count); 1 runs in-process
+
+        Returns:
+            Analyses in the same order as jobs; all are saved with a single write
+        """
+        if max_workers == 1 or len(jobs) < 2:
+            analyses = [self._build_analysis(cv_text, *job) for job in jobs]
+        else:
+            # The CV travels once per worker (initargs), not once per job
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_batch_worker,
+                initargs=(str(self.data_dir), cv_text, dict(self.WEIGHTS)),
+            ) as pool:
+                analyses = list(pool.map(_analyze_in_worker, jobs, chunksize=BATCH_CHUNK_SIZE))
+
+        self.analyzed_jobs.extend(analyses)
+        for analysis in analyses:
+            self._analyses_by_id.setdefault(analysis["job_id"], analysis)
+        self._maybe_flush(self.jobs_file, self.analyzed_jobs, force=True)
+
+        return analyses
+
+    def _build_analysis(
+        self, cv_text: str, job_text: str, job_title: str = "", company: str = ""
+    ) -> Dict[str, Any]:
+        """Parse, score and gap-check one CV/job pair without saving it"""
         cv_data: Dict[str, Any] = self.parse_cv(cv_text)
         job_data: Dict[str, Any] = self.parse_job(job_text, job_title, company)
 
+        # Lowercased CV skills, shared by scoring and gap analysis
+        cv_flat: FrozenSet[str] = self._flatten_skills(cv_data["skills"])
+
         # Calculate match score
-        score_result: Dict[str, Any] = self._calculate_score(cv_data, job_data)
+        score_result: Dict[str, Any] = self._calculate_score(cv_data, job_data, cv_flat)
 
         # Identify gaps
-        gaps: Dict[str, Any] = self._identify_gaps(cv_data, job_data)
+        gaps: Dict[str, Any] = self._identify_gaps(cv_data, job_data, cv_flat)
 
         # Generate recommendations
         recommendations: List[Dict[str, Any]] = self._generate_recommendations(gaps, score_result)
@@ -472,13 +1136,10 @@ class AdvancedJobEngine:
             "recommendations": recommendations,
             "cv_snapshot": cv_data,
             "job_snapshot": job_data,
-            "analysis_date": datetime.now().isoformat(),
+            # Same instant parse_job just stamped; no second clock read
+            "analysis_date": job_data["analyzed_date"],
         }
 
-        # Save analysis
-        self.analyzed_jobs.append(analysis)
-        self._save_json(self.jobs_file, self.analyzed_jobs)
-
         return analysis
 
     def create_learning_plan(
@@ -498,15 +1159,16 @@ class AdvancedJobEngine:
 
         # Set duration based on mode
         duration: str = "12 weeks" if mode == "standard" else "16-24 weeks"
+        now: datetime = datetime.now()
 
         plan: Dict[str, Any] = {
-            "plan_id": f"LP_{analysis['job_id']}_{datetime.now().strftime('%Y%m%d')}",
+            "plan_id": f"LP_{analysis['job_id']}_{now.strftime('%Y%m%d')}",
             "mode": mode,
             "job_reference": {
                 "title": analysis["job_info"]["title"],
                 "company": analysis["job_info"]["company"],
             },
-            "created_date": datetime.now().isoformat(),
+            "created_date": now.isoformat(),
             "estimated_duration": duration,
             "levels": {"study": [], "practice": [], "courses": []},
             "weekly_schedule": [],
@@ -584,11 +1246,13 @@ class AdvancedJobEngine:
             Sprint configuration dictionary
         """
         sprint_num: int = self.state.get("current_sprint",0) + 1
+        now: datetime = datetime.now()
+        now_iso: str = now.isoformat()
 
         sprint: Dict[str, Any] = {
             "sprint_number": sprint_num,
-            "start_date": datetime.now().isoformat(),
-            "end_date": (datetime.now() + timedelta(days=14)).isoformat(),
+            "start_date": now_iso,
+            "end_date": (now + timedelta(days=14)).isoformat(),
             "skills_targeted": skills,
             "project_goal": project_goal,
             "daily_logs": [],
@@ -598,11 +1262,11 @@ class AdvancedJobEngine:
         self.state["current_sprint"] = sprint_num
         self.state["mode"] = "reverse"
         if not self.state.get("started_date"):
-            self.state["started_date"] = datetime.now().isoformat()
-        self._save_json(self.state_file, self.state)
+            self.state["started_date"] = now_iso
+        self._maybe_flush(self.state_file, self.state, force=True)
 
         self.sprint_history.append(sprint)
-        self._save_json(self.sprints_file, self.sprint_history)
+        self._maybe_flush(self.sprints_file, self.sprint_history, force=True)
 
         print(f"\n🏃 Sprint {sprint_num} Started")
         print(f"   Skills: {', '.join(skills)}")
@@ -640,7 +1304,7 @@ class AdvancedJobEngine:
         }
 
         current_sprint["daily_logs"].append(log_entry)
-        self._save_json(self.sprints_file, self.sprint_history)
+        self._maybe_flush(self.sprints_file, self.sprint_history)
 
         total_hours: float = sum(log["hours"] for log in current_sprint["daily_logs"])
 
@@ -670,41 +1334,39 @@ class AdvancedJobEngine:
             return {}
 
         sprint_num: int = current_sprint["sprint_number"]
+        now_iso: str = datetime.now().isoformat()
+        # Read before this sprint is flagged completed so it isn't counted twice
+        hours_before: float = self._completed_sprint_hours()
 
         print(f"\n🏁 Sprint {sprint_num} Assessment")
         print("=" * 60)
 
         # Record results
         current_sprint["completed"] = True
-        current_sprint["completion_date"] = datetime.now().isoformat()
+        current_sprint["completion_date"] = now_iso
         current_sprint["project_url"] = project_url
         current_sprint["test_scores"] = test_scores
 
         total_hours: float = sum(log["hours"] for log in current_sprint["daily_logs"])
         current_sprint["total_hours"] = total_hours
+        self.state["total_hours_cached"] = hours_before + total_hours
 
         # Update mastered skills
         newly_mastered: List[str] = []
+        skills_mastered: set = self.state["skills_mastered"]
+        tests_passed: Dict[str, set] = self.state["tests_passed"]
         for skill, score in test_scores.items():
-            if score >= 60 and skill not in self.state["skills_mastered"]:
-                self.state["skills_mastered"].append(skill)
+            if score >= 60 and skill not in skills_mastered:
+                skills_mastered.add(skill)
                 newly_mastered.append(skill)
                 print(f"   ✅ Mastered: {skill} (Score: {score}%)")
 
             # Track test level passed
-            if skill not in self.state["tests_passed"]:
-                self.state["tests_passed"][skill] = []
-
-            level: Optional[str] = None
-            if score >= 80:
-                level = "advanced"
-            elif score >= 70:
-                level = "intermediate"
-            elif score >= 60:
-                level = "beginner"
+            passed_levels: set = tests_passed.setdefault(skill, set())
 
-            if level and level not in self.state["tests_passed"][skill]:
-                self.state["tests_passed"][skill].append(level)
+            level: Optional[str] = _LEVEL_BY_RANK[bisect_right(_PASS_SCORES, score)]
+            if level:
+                passed_levels.add(level)
 
         # Add project
         project_entry: Dict[str, Any] = {
@@ -712,16 +1374,16 @@ class AdvancedJobEngine:
             "goal": current_sprint["project_goal"],
             "url": project_url,
             "skills": current_sprint["skills_targeted"],
-            "completion_date": datetime.now().isoformat(),
+            "completion_date": now_iso,
         }
         self.state["projects_completed"].append(project_entry)
 
-        self._save_json(self.sprints_file, self.sprint_history)
-        self._save_json(self.state_file, self.state)
-
-        # Check quality gates
+        # Check quality gates, then persist sprint and state once
         gates_passed: Dict[str, bool] = self.check_quality_gates()
 
+        self._maybe_flush(self.sprints_file, self.sprint_history, force=True)
+        self._maybe_flush(self.state_file, self.state, force=True)
+
         # Summary
         summary: Dict[str, Any] = {
             "sprint": sprint_num,
@@ -740,6 +1402,23 @@ class AdvancedJobEngine:
 
         return summary
 
+    def _completed_sprint_hours(self) -> float:
+        """
+        Total learning hours across completed sprints
+
+        Kept as a running total in state["total_hours_cached"] by end_sprint;
+        states saved before the total existed are summed from sprint_history once.
+        """
+        total = self.state.get("total_hours_cached")
+        if total is None:
+            total = sum(
+                sprint.get("total_hours", 0)
+                for sprint in self.sprint_history
+                if isinstance(sprint, dict) and sprint.get("completed")
+            )
+            self.state["total_hours_cached"] = total
+        return total
+
     def check_quality_gates(self) -> Dict[str, bool]:
         """
         Check which quality gates have been passed
@@ -749,8 +1428,11 @@ class AdvancedJobEngine:
         """
         gates_status: Dict[str, bool] = {}
         newly_passed: List[str] = []
+        already_passed: set = set(self.state["quality_gates_passed"])
         score: int = self.state["current_score"]
         projects: int = len(self.state["projects_completed"])
+        # Every test level any skill has reached, gathered once for all gates
+        levels_passed: set = set().union(*self.state["tests_passed"].values())
 
         for gate_name, requirements in self.QUALITY_GATES.items():
             # FIXED: Explicitly cast requirements to proper type
@@ -766,33 +1448,26 @@ class AdvancedJobEngine:
             if "brand" in req_dict:
                 additional_met = self.state.get("brand_ready", False)
             elif "tests_passed" in req_dict:
-                level: str = req_dict["tests_passed"]
                 # Check if at least one skill has passed this level
-                additional_met = any(
-                    level in levels for levels in self.state["tests_passed"].values()
-                )
+                additional_met = req_dict["tests_passed"] in levels_passed
 
             passed: bool = score_met and projects_met and additional_met
             gates_status[gate_name] = passed
 
             # Track newly passed gates
-            if passed and gate_name not in self.state["quality_gates_passed"]:
+            if passed and gate_name not in already_passed:
+                already_passed.add(gate_name)
                 self.state["quality_gates_passed"].append(gate_name)
                 newly_passed.append(gate_name)
                 print(f"   🏆 Quality Gate Passed: {gate_name.upper()}")
 
                 # Update stage
-                if gate_name == "foundation":
-                    self.state["current_stage"] = "skill_building"
-                elif gate_name == "competency":
-                    self.state["current_stage"] = "mastery"
-                elif gate_name == "mastery":
-                    self.state["current_stage"] = "positioning"
-                elif gate_name == "application_ready":
-                    self.state["current_stage"] = "ready"
+                self.state["current_stage"] = _NEXT_STAGE.get(
+                    gate_name, self.state["current_stage"]
+                )
 
         if newly_passed:
-            self._save_json(self.state_file, self.state)
+            self._maybe_flush(self.state_file, self.state)
 
         return gates_status
 
@@ -803,162 +1478,77 @@ class AdvancedJobEngine:
         Returns:
             Comprehensive checklist for market positioning
         """
-        print("\n" + "=" * 80)
-        print("STAGE 5: MARKET POSITIONING & VISIBILITY")
-        print("=" * 80)
+        print("\n" + "=" * 80 + "\nSTAGE 5: MARKET POSITIONING & VISIBILITY\n" + "=" * 80)
 
         if self.state["current_score"] < 85:
-            print(f"\n⚠️ Current Score: {self.state['current_score']}%")
-            print("   Recommended: Reach 85%+ before positioning stage")
-            print("   Continue skill building and project work")
+            print(
+                f"\n⚠️ Current Score: {self.state['current_score']}%\n"
+                "   Recommended: Reach 85%+ before positioning stage\n"
+                "   Continue skill building and project work"
+            )
             return {}
 
-        checklist: Dict[str, Any] = {
-            "linkedin_profile": {
-                "priority": "CRITICAL",
-                "tasks": [
-                    "Add all new skills to Skills section",
-                    "Showcase 5+ portfolio projects in Featured section",
-                    "Write detailed experience descriptions with metrics",
-                    "Professional photo and compelling headline",
-                    "Get 3+ recommendations from colleagues/mentors",
-                    "Join relevant groups and engage weekly",
-                    "Share technical content regularly",
-                ],
-            },
-            "github_portfolio": {
-                "priority": "CRITICAL",
-                "tasks": [
-                    "Organize repositories professionally with topics/tags",
-                    "Comprehensive READMEs for all major projects",
-                    "Pin best 6 projects to profile",
-                    "Active contribution graph (green squares daily)",
-                    "Profile README with portfolio showcase and bio",
-                    "Clean up code, add comments and documentation",
-                    "Include live demos or screenshots",
-                ],
-            },
-            "technical_content": {
-                "priority": "HIGH",
-                "tasks": [
-                    "Write 3-5 technical blog posts (Medium, Dev.to)",
-                    "Create tutorial or guide in your specialty",
-                    "Document your learning journey publicly",
-                    "Share insights on LinkedIn 2-3x per week",
-                    "Answer questions on Stack Overflow",
-                    "Contribute to technical discussions",
-                ],
-            },
-            "personal_website": {
-                "priority": "MEDIUM",
-                "tasks": [
-                    "Portfolio showcase page with project cards",
-                    "About/story section telling your journey",
-                    "Contact information and social links",
-                    "Resume download (PDF)",
-                    "Blog or articles section (optional)",
-                    "Mobile-responsive design",
-                    "SEO optimization",
-                ],
-            },
-            "networking": {
-                "priority": "HIGH",
-                "tasks": [
-                    "Connect with 20+ relevant professionals on LinkedIn",
-                    "Join 3+ industry communities/Slack groups",
-                    "Attend 2+ virtual meetups or webinars monthly",
-                    "Engage with target company employees",
-                    "Request 5+ informational interviews",
-                    "Follow up and maintain relationships",
-                    "Offer value before asking for help",
-                ],
-            },
-        }
-
-        print("\n📋 Professional Branding Checklist:\n")
-        for area, info in checklist.items():
-            print(f"📌 {area.replace('_', ' ').title()} [{info['priority']}]:")
-            for task in info["tasks"]:
-                print(f"   ☐ {task}")
-            print()
-
-        print("=" * 80)
-        print("TRACKING YOUR POSITIONING PROGRESS:")
-        print("=" * 80)
-        print(
-            """
-# When LinkedIn is polished:
-engine.state['linkedin_ready'] = True
-
-# When GitHub portfolio is professional:
-engine.state['github_ready'] = True
-
-# When overall brand is ready:
-engine.state['brand_ready'] = True
+        checklist: Dict[str, Any] = _thaw(POSITIONING_CHECKLIST)
 
-# When network is established:
-engine.state['network_ready'] = True
-
-# Save state:
-engine._save_json(engine.state_file, engine.state)
-
-# Check if application ready:
-engine.check_quality_gates()
-"""
-        )
-
-        print("\n💡 PRO TIPS:")
-        print("   • Quality over quantity - 5 great projects > 20 mediocre ones")
-        print("   • Consistency matters - regular activity shows dedication")
-        print("   • Engagement beats broadcasting - comment, discuss, help others")
-        print("   • Tell your story - people connect with journeys, not just skills")
-        print("   • Be authentic - genuine passion shines through")
+        # The checklist, tracking snippet and tips never change: one write
+        print(_POSITIONING_GUIDE)
 
         return checklist
 
     def display_progress_dashboard(self) -> None:
         """Display comprehensive progress dashboard"""
+        # Checkpoint: make sure anything debounced is on disk
+        self.flush_state()
+
         print("\n" + "=" * 80)
         print("PROGRESS DASHBOARD")
         print("=" * 80)
 
         state = self.state
+        baseline: int = state.get("baseline_score", 0)
+        current: int = state.get("current_score", 0)
+        skills_mastered = state.get("skills_mastered", ())
+        projects: List[Dict[str, Any]] = state.get("projects_completed", ())
+        tests_passed: Dict[str, Any] = state.get("tests_passed", {})
+        gates_passed = set(state.get("quality_gates_passed", ()))
+        test_levels = self.TEST_LEVELS
 
         print("\n📊 CURRENT STATUS:")
         print(f"   Mode: {state.get('mode') or 'Not started'}")
         print(f"   Stage: {state.get('current_stage', 'baseline')}")
-        print(f"   Baseline Score: {state.get('baseline_score', 0)}%")
-        print(f"   Current Score: {state.get('current_score', 0)}%")
+        print(f"   Baseline Score: {baseline}%")
+        print(f"   Current Score: {current}%")
         print(f"   Target Score: {state.get('target_score', 90)}%")
 
 
-        if state.get('baseline_score', 0) > 0:
-            improvement: int = state.get('current_score', 0) - state.get('baseline_score', 0)
+        if baseline > 0:
+            improvement: int = current - baseline
             print(f"   Improvement: +{improvement}%")
 
         print("\n🏃 SPRINT PROGRESS:")
         print(f"   Total Sprints: {state.get('current_sprint', 0)}")
-        print(f"   Skills Mastered: {len(state.get('skills_mastered', []))}")
-        if state.get('skills_mastered', []):
-            print(f"      → {', '.join(state.get('skills_mastered', [])[:10])}")
+        print(f"   Skills Mastered: {len(skills_mastered)}")
+        if skills_mastered:
+            # First 10 alphabetically without sorting the whole set
+            print(f"      → {', '.join(heapq.nsmallest(10, skills_mastered))}")
 
-        print(f"\n🗂️ PROJECTS COMPLETED: {len(state.get('projects_completed', []))}")
-        for i, project in enumerate(state.get("projects_completed", [])[-5:], 1):
+        print(f"\n🗂️ PROJECTS COMPLETED: {len(projects)}")
+        for i, project in enumerate(projects[-5:], 1):
             print(f"   {i}. Sprint {project['sprint']}: {project['goal']}")
             print(f"      Skills: {', '.join(project['skills'])}")
             print(f"      URL: {project['url']}")
 
         print("\n📝 TESTS PASSED:")
-        if state.get("tests_passed", {}):
-            for skill, levels in state.get("tests_passed", {}).items():
-                print(f"   {skill}: {', '.join(levels)}")
+        if tests_passed:
+            for skill, levels in tests_passed.items():
+                print(f"   {skill}: {', '.join(lvl for lvl in test_levels if lvl in levels)}")
         else:
             print("   No tests passed yet")
 
         print("\n🏆 QUALITY GATES:")
-        for gate in self.QUALITY_GATES.keys():
-            status: str = "✅" if gate in state.get("quality_gates_passed", []) else "⏳"
-            print(f"   {status} {gate.replace('_', ' ').title()}")
+        for gate in self.QUALITY_GATES:
+            status: str = "✅" if gate in gates_passed else "⏳"
+            print(f"   {status} {_DISPLAY_TITLES[gate]}")
 
         print("\n🎯 READINESS FLAGS:")
         print(f"   Brand Ready: {'✅' if state.get('brand_ready') else '⏳'}")
@@ -973,12 +1563,7 @@ engine.check_quality_gates()
             print(f"   Days Elapsed: {days_elapsed}")
 
             if self.sprint_history:
-                total_hours: float = sum(
-                    sprint.get("total_hours", 0)
-                    for sprint in self.sprint_history
-                    if isinstance(sprint, dict) and sprint.get("completed")
-                )
-                print(f"   Total Learning Hours: {total_hours}h")
+                print(f"   Total Learning Hours: {self._completed_sprint_hours()}h")
 
         print("\n" + "=" * 80)
  
@@ -995,87 +1580,21 @@ engine.check_quality_gates()
             "current_score": analysis["score"]["total_score"],
             "target_score": 80,
             "timeline": "12 weeks",
-            "phases": [],
         }
 
-        # Phase 1: Foundation (Weeks 1-4)
-        strategy["phases"].append(
-            {
-                "phase": 1,
-                "name": "Foundation Building",
-                "duration": "4 weeks",
-                "focus": "Critical required skills",
-                "objectives": [
-                    f"Master {skill}" for skill in analysis["gaps"]["missing_required_skills"][:3]
-                ],
-                "activities": [
-                    "Complete foundational courses",
-                    "Study documentation and tutorials",
-                    "Build 2-3 small projects",
-                ],
-                "success_criteria": [
-                    "Pass beginner level tests",
-                    "Complete 3 hands-on projects",
-                    "Demonstrate basic proficiency",
-                ],
-                "expected_score_increase": 15,
-            }
-        )
-
-        # Phase 2: Skill Development (Weeks 5-8)
-        strategy["phases"].append(
-            {
-                "phase": 2,
-                "name": "Skill Development",
-                "duration": "4 weeks",
-                "focus": "Advanced skills and practice",
-                "objectives": [
-                    "Deepen understanding of core technologies",
-                    "Build portfolio projects",
-                    "Gain practical experience",
-                ],
-                "activities": [
-                    "Complete intermediate courses",
-                    "Contribute to open source",
-                    "Build 2-3 medium complexity projects",
-                    "Practice coding challenges daily",
-                ],
-                "success_criteria": [
-                    "Pass intermediate level tests",
-                    "Complete 3 portfolio projects",
-                    "Demonstrate intermediate proficiency",
-                ],
-                "expected_score_increase": 15,
-            }
-        )
-
-        # Phase 3: Mastery & Application (Weeks 9-12)
-        strategy["phases"].append(
-            {
-                "phase": 3,
-                "name": "Mastery & Job Application",
-                "duration": "4 weeks",
-                "focus": "Advanced topics and job preparation",
-                "objectives": [
-                    "Master all required skills",
-                    "Build comprehensive portfolio",
-                    "Prepare for interviews",
-                ],
-                "activities": [
-                    "Complete advanced courses",
-                    "Build 1-2 advanced projects",
-                    "Practice system design",
-                    "Mock interviews",
-                    "Update CV and LinkedIn",
-                ],
-                "success_criteria": [
-                    "Pass advanced level tests",
-                    "Have 5+ strong portfolio projects",
-                    "Ready for interviews",
-                ],
-                "expected_score_increase": 10,
-            }
-        )
+        # Fresh plain copies: callers may extend the phases' lists
+        foundation, development, mastery = _thaw(_STRATEGY_PHASES)
+        foundation["objectives"] = [
+            f"Master {skill}" for skill in analysis["gaps"]["missing_required_skills"][:3]
+        ]
+        strategy["phases"] = [
+            # Phase 1: Foundation (Weeks 1-4)
+            foundation,
+            # Phase 2: Skill Development (Weeks 5-8)
+            development,
+            # Phase 3: Mastery & Application (Weeks 9-12)
+            mastery,
+        ]
 
         strategy["action_items"] = self._generate_action_items(analysis, learning_plan)
 
@@ -1092,9 +1611,10 @@ engine.check_quality_gates()
         """
         STEP 5: Generate three-level tests to measure progress
         """
+        now: datetime = datetime.now()
         tests: Dict[str, Any] = {
-            "test_suite_id": f"TEST_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-            "created_date": datetime.now().isoformat(),
+            "test_suite_id": f"TEST_{now.strftime('%Y%m%d_%H%M%S')}",
+            "created_date": now.isoformat(),
             "skills_covered": skills,
             "levels": {},
         }
@@ -1113,7 +1633,7 @@ engine.check_quality_gates()
 
     def _generate_test(self, skill: str, level: str) -> Dict[str, Any]:
         """Generate test for specific skill and level"""
-        config: Dict[str, int] = self.TEST_LEVELS[level]
+        config: Mapping[str, int] = self.TEST_LEVELS[level]
 
         test: Dict[str, Any] = {
             "skill": skill,
@@ -1132,7 +1652,7 @@ engine.check_quality_gates()
                 f"Simple problem solving with {skill}",
                 f"Understanding {skill} documentation",
             ]
-            test["sample_questions"] = self._generate_beginner_questions(skill)
+            questions = self._generate_beginner_questions(skill)
 
         elif level == "intermediate":
             test["question_types"] = [
@@ -1142,7 +1662,7 @@ engine.check_quality_gates()
                 "Integration with other technologies",
                 "Performance optimization",
             ]
-            test["sample_questions"] = self._generate_intermediate_questions(skill)
+            questions = self._generate_intermediate_questions(skill)
 
         else:
             test["question_types"] = [
@@ -1152,7 +1672,10 @@ engine.check_quality_gates()
                 "Architecture decisions",
                 "Production considerations",
             ]
-            test["sample_questions"] = self._generate_advanced_questions(skill)
+            questions = self._generate_advanced_questions(skill)
+
+        # The cached question pairs are immutable; each test gets its own dicts
+        test["sample_questions"] = [{"q": q, "type": q_type} for q, q_type in questions]
 
         test["assessment_criteria"] = {
             "technical_accuracy": 40,
@@ -1163,122 +1686,66 @@ engine.check_quality_gates()
 
         return test
 
-    def _generate_beginner_questions(self, skill: str) -> List[Dict[str, str]]:
+    @staticmethod
+    def _fill_questions(
+        templates: Tuple[Mapping[str, str], ...], skill: str
+    ) -> Tuple[Tuple[str, str], ...]:
+        """Substitute the skill into frozen question templates as (question, type) pairs"""
+        return tuple(
+            (template["q"].format(skill=skill), template["type"]) for template in templates
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _generate_beginner_questions(skill: str) -> Tuple[Tuple[str, str], ...]:
         """Generate beginner level questions"""
-        templates: Dict[str, List[Dict[str, str]]] = {
-            "python": [
-                {
-                    "q": "What is the difference between a list and tuple in Python?",
-                    "type": "concept",
-                },
-                {"q": "Write a function to reverse a string", "type": "coding"},
-                {"q": "Explain what a dictionary is and give an example", "type": "concept"},
-                {"q": "How do you handle exceptions in Python?", "type": "concept"},
-                {"q": "Write a program to find the sum of numbers in a list", "type": "coding"},
-            ],
-            "sql": [
-                {"q": "What is the difference between WHERE and HAVING?", "type": "concept"},
-                {"q": "Write a query to select all users with age > 25", "type": "coding"},
-                {"q": "Explain what a JOIN is", "type": "concept"},
-                {"q": "How do you sort results in ascending order?", "type": "concept"},
-                {"q": "Write a query to count records in a table", "type": "coding"},
-            ],
-            "default": [
-                {"q": f"What are the basic concepts of {skill}?", "type": "concept"},
-                {"q": f"How do you get started with {skill}?", "type": "concept"},
-                {"q": f"What are common use cases for {skill}?", "type": "concept"},
-                {"q": f"Solve a simple problem using {skill}", "type": "coding"},
-                {"q": f"Explain key terminology in {skill}", "type": "concept"},
-            ],
-        }
-        return templates.get(skill.lower(), templates["default"])[:5]
+        templates = _BEGINNER_QUESTIONS.get(skill.lower(), _BEGINNER_QUESTIONS["default"])
+        return AdvancedJobEngine._fill_questions(templates[:5], skill)
 
-    def _generate_intermediate_questions(self, skill: str) -> List[Dict[str, str]]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _generate_intermediate_questions(skill: str) -> Tuple[Tuple[str, str], ...]:
         """Generate intermediate level questions"""
-        return [
-            {"q": f"Design a solution for [problem] using {skill}", "type": "design"},
-            {
-                "q": f"What are the performance considerations when using {skill}?",
-                "type": "concept",
-            },
-            {"q": f"How do you debug issues in {skill}?", "type": "practical"},
-            {"q": f"Implement [complex feature] using {skill}", "type": "coding"},
-            {"q": f"Compare {skill} with alternative solutions", "type": "analysis"},
-        ]
+        return AdvancedJobEngine._fill_questions(_INTERMEDIATE_QUESTIONS, skill)
 
-    def _generate_advanced_questions(self, skill: str) -> List[Dict[str, str]]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _generate_advanced_questions(skill: str) -> Tuple[Tuple[str, str], ...]:
         """Generate advanced level questions"""
-        return [
-            {"q": f"Design a scalable system using {skill}", "type": "system_design"},
-            {"q": f"How would you optimize {skill} for production?", "type": "optimization"},
-            {"q": f"Explain advanced architectural patterns with {skill}", "type": "architecture"},
-            {"q": f"Solve a complex real-world problem with {skill}", "type": "coding"},
-            {"q": f"What are the trade-offs when choosing {skill}?", "type": "analysis"},
-        ]
+        return AdvancedJobEngine._fill_questions(_ADVANCED_QUESTIONS, skill)
 
     def update_skillset(self, new_skills: List[str], category: str = "technical") -> Dict[str, Any]:
         """
         STEP 6: Update master skillset with newly acquired skills
         """
         updated: List[str] = []
+        index: Dict[str, set] = self._skillset_index
 
         for skill in new_skills:
             skill_lower: str = skill.lower().strip()
 
             if category == "technical":
-                if skill_lower in [
-                    "python",
-                    "java",
-                    "javascript",
-                    "c++",
-                    "go",
-                    "rust",
-                    "scala",
-                    "r",
-                ]:
-                    subcategory: str = "programming"
-                elif skill_lower in [
-                    "pytorch",
-                    "tensorflow",
-                    "react",
-                    "django",
-                    "flask",
-                    "spring",
-                    "angular",
-                ]:
-                    subcategory = "frameworks"
-                elif skill_lower in [
-                    "docker",
-                    "kubernetes",
-                    "git",
-                    "jenkins",
-                    "terraform",
-                    "ansible",
-                ]:
-                    subcategory = "tools"
-                elif skill_lower in ["postgresql", "mongodb", "mysql", "redis", "cassandra"]:
-                    subcategory = "databases"
-                elif skill_lower in ["aws", "azure", "gcp"]:
-                    subcategory = "cloud"
-                else:
-                    subcategory = "tools"
+                subcategory: str = _SKILLSET_SUBCATEGORY.get(skill_lower, "tools")
 
-                if skill not in self.master_skillset["technical_skills"][subcategory]:
+                if skill not in index[subcategory]:
+                    index[subcategory].add(skill)
                     self.master_skillset["technical_skills"][subcategory].append(skill)
                     updated.append(skill)
 
             elif category == "certification":
-                if skill not in self.master_skillset["certifications"]:
+                if skill not in index["certifications"]:
+                    index["certifications"].add(skill)
                     self.master_skillset["certifications"].append(skill)
                     updated.append(skill)
 
             elif category == "soft":
-                if skill not in self.master_skillset["soft_skills"]:
+                if skill not in index["soft_skills"]:
+                    index["soft_skills"].add(skill)
                     self.master_skillset["soft_skills"].append(skill)
                     updated.append(skill)
 
         self.master_skillset["last_updated"] = datetime.now().isoformat()
-        self._save_json(self.skillset_file, self.master_skillset)
+        self._maybe_flush(self.skillset_file, self.master_skillset, force=True)
 
         return {
             "updated_skills": updated,
@@ -1294,9 +1761,10 @@ engine.check_quality_gates()
         """
         job_info: Dict[str, str] = analysis["job_info"]
         score: float = analysis["score"]["total_score"]
+        now: datetime = datetime.now()
 
         letters: Dict[str, Any] = {
-            "generated_date": datetime.now().isoformat(),
+            "generated_date": now.isoformat(),
             "job_reference": job_info,
             "templates": {},
         }
@@ -1307,7 +1775,7 @@ engine.check_quality_gates()
             letters["templates"]["cover_letter"] = self._generate_growth_letter(analysis)
         else:
             letters["templates"]["cover_letter"] = self._generate_future_interest_letter(
-                analysis, learning_plan
+                analysis, learning_plan, now
             )
 
         letters["templates"]["linkedin_message"] = self._generate_linkedin_message(analysis)
@@ -1328,7 +1796,8 @@ engine.check_quality_gates()
         for category in cv["skills"].values():
             matching_skills.extend(category[:3])
 
-        letter: str = f"""
+        parts: List[str] = [
+            f"""
 Dear Hiring Manager,
 
 I am writing to express my strong interest in the {job['title']} position at {job['company']}. With {cv['experience_years']} years of relevant experience and a proven track record in the key areas you're seeking, I am confident I would be a valuable addition to your team.
@@ -1336,18 +1805,23 @@ I am writing to express my strong interest in the {job['title']} position at {jo
 KEY QUALIFICATIONS:
 
 """
-        for skill in matching_skills[:5]:
-            letter += f"✓ Proficient in {skill} with hands-on project experience\n"
+        ]
+        parts.extend(
+            f"✓ Proficient in {skill} with hands-on project experience\n"
+            for skill in matching_skills[:5]
+        )
 
-        letter += """
+        parts.append(
+            """
 RELEVANT EXPERIENCE:
 I have successfully delivered projects involving:
 """
+        )
 
-        for project in cv["projects"][:3]:
-            letter += f"• {project}\n"
+        parts.extend(f"• {project}\n" for project in cv["projects"][:3])
 
-        letter += f"""
+        parts.append(
+            f"""
 I am particularly excited about this opportunity because it aligns perfectly with my career goals and expertise. I am immediately available and eager to contribute to {job['company']}'s success.
 
 I would welcome the opportunity to discuss how my skills and experience can benefit your team. Thank you for considering my application.
@@ -1364,8 +1838,9 @@ ATTACHMENTS:
 - Portfolio (if applicable)
 - References (upon request)
 """
+        )
 
-        return letter
+        return "".join(parts)
 
     def _generate_growth_letter(self, analysis: Dict[str, Any]) -> str:
         """Generate cover letter emphasizing growth potential"""
@@ -1373,25 +1848,34 @@ ATTACHMENTS:
         cv: Dict[str, Any] = analysis["cv_snapshot"]
         gaps: Dict[str, Any] = analysis["gaps"]
 
-        letter: str = f"""Dear Hiring Manager,
+        parts: List[str] = [
+            f"""Dear Hiring Manager,
 
 I am excited to apply for the {job['title']} position at {job['company']}. While I am actively developing expertise in some of the technologies you require, I bring strong foundational skills and a demonstrated ability to quickly learn and adapt.
 
 CORE STRENGTHS:
 
 """
-        for skill in list(cv["skills"].get("programming", []))[:3]:
-            letter += f"✓ Strong proficiency in {skill}\n"
+        ]
+        parts.extend(
+            f"✓ Strong proficiency in {skill}\n"
+            for skill in list(cv["skills"].get("programming", []))[:3]
+        )
 
-        letter += """
+        parts.append(
+            """
 CURRENT DEVELOPMENT:
 
 I am currently upskilling in the following areas to match your requirements:
 """
-        for skill in gaps["missing_required_skills"][:3]:
-            letter += f"• {skill} - Actively learning through hands-on projects\n"
+        )
+        parts.extend(
+            f"• {skill} - Actively learning through hands-on projects\n"
+            for skill in gaps["missing_required_skills"][:3]
+        )
 
-        letter += f"""
+        parts.append(
+            f"""
 I am a fast learner with a track record of mastering new technologies quickly. My {cv['experience_years']} years of experience have equipped me with strong problem-solving skills and the ability to deliver results under pressure.
 
 I would appreciate the opportunity to discuss how my current skills and enthusiasm for continuous learning make me a strong candidate for this role.
@@ -1401,37 +1885,46 @@ Thank you for your consideration.
 Best regards,
 [Your Name]
 """
-        return letter
+        )
+        return "".join(parts)
 
     def _generate_future_interest_letter(
-        self, analysis: Dict[str, Any], learning_plan: Optional[Dict[str, Any]] = None
+        self,
+        analysis: Dict[str, Any],
+        learning_plan: Optional[Dict[str, Any]] = None,
+        now: Optional[datetime] = None,
     ) -> str:
         """Generate letter expressing future interest"""
         job: Dict[str, str] = analysis["job_info"]
+        now = now or datetime.now()
 
-        letter: str = f"""Dear Hiring Manager,
+        parts: List[str] = [
+            f"""Dear Hiring Manager,
 
 I am writing to express my interest in future opportunities at {job['company']}, specifically in roles similar to the {job['title']} position.
 
 While I am currently building expertise in some key areas required for this role, I am highly motivated and following a structured learning plan to develop these skills.
 
 """
+        ]
 
         if learning_plan:
-            letter += f"""MY DEVELOPMENT PLAN:
+            parts.append(
+                f"""MY DEVELOPMENT PLAN:
 
 I am currently engaged in a {learning_plan['estimated_duration']} intensive learning program covering:
 """
-            for item in learning_plan["levels"]["study"][:3]:
-                letter += f"• {item['skill']}\n"
+            )
+            parts.extend(f"• {item['skill']}\n" for item in learning_plan["levels"]["study"][:3])
 
-            letter += f"""
+            parts.append(
+                f"""
 I am reaching out now to:
 1. Express my strong interest in {job['company']}
 2. Request to stay connected for future opportunities
 3. Seek any advice on skill development priorities
 
-I am targeting {(datetime.now() + timedelta(days=90)).strftime('%B %Y')} for actively applying to similar positions after completing my upskilling program.
+I am targeting {(now + timedelta(days=90)).strftime('%B %Y')} for actively applying to similar positions after completing my upskilling program.
 
 Would it be possible to schedule a brief informational call to learn more about your team and future opportunities?
 
@@ -1440,7 +1933,8 @@ Thank you for your time and consideration.
 Best regards,
 [Your Name]
 """
-        return letter
+            )
+        return "".join(parts)
 
     def _generate_linkedin_message(self, analysis: Dict[str, Any]) -> str:
         """Generate LinkedIn connection request message"""
@@ -1510,93 +2004,56 @@ Best regards,
 
     # ========== HELPER METHODS ==========
 
-    def _extract_all_skills(self, text: str) -> Dict[str, List[str]]:
+    def _extract_all_skills(self, text_lower: str) -> Dict[str, List[str]]:
         """Extract all skills from text"""
         skills: Dict[str, List[str]] = defaultdict(list)
-        text_lower: str = text.lower()
-
-        skill_patterns: Dict[str, List[str]] = {
-            "programming": ["python", "java", "javascript", "c++", "go", "rust", "scala", "r"],
-            "frameworks": [
-                "pytorch",
-                "tensorflow",
-                "react",
-                "django",
-                "flask",
-                "spring",
-                "angular",
-            ],
-            "tools": ["docker", "kubernetes", "git", "jenkins", "terraform", "ansible"],
-            "databases": ["postgresql", "mongodb", "mysql", "redis", "cassandra"],
-            "cloud": ["aws", "azure", "gcp", "google cloud"],
-        }
 
-        for category, keywords in skill_patterns.items():
-            for skill in keywords:
-                if re.search(r"\b" + re.escape(skill) + r"\b", text_lower):
-                    skills[category].append(skill)
+        # A single-word skill matches \bskill\b exactly when it is one of the
+        # text's maximal word runs, so tokenize once and test set membership
+        tokens = set(_WORD_RE.findall(text_lower))
+
+        for skill, category in _SUBCATEGORY_MAP.items():
+            pattern = _PHRASE_SKILLS.get(skill)
+            if pattern is not None:
+                # Cheap substring test first; the regex only confirms boundaries
+                found = skill in text_lower and pattern.search(text_lower) is not None
+            else:
+                found = skill in tokens
+            if found:
+                skills[category].append(skill)
 
         return dict(skills)
 
-    def _extract_experience(self, text: str) -> int:
+    def _extract_experience(self, text_lower: str) -> int:
         """Extract years of experience"""
-        years: List[int] = []
-        patterns: List[str] = [
-            r"(\d+)\+?\s*years?\s+(?:of\s+)?experience",
-            r"experience:\s*(\d+)",
-            r"(\d+)\s*years?\s+in",
-        ]
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            years.extend([int(m) for m in matches])
-        return max(years) if years else 0
+        return max(
+            (
+                int(group)
+                for match in _CV_EXPERIENCE_RE.finditer(text_lower)
+                for group in match.groups()
+                if group
+            ),
+            default=0,
+        )
 
-    def _extract_education(self, text: str) -> List[str]:
+    def _extract_education(self, text_lower: str) -> List[str]:
         """Extract education"""
-        degrees: List[str] = []
-        if re.search(r"\b(phd|ph\.d|doctorate)\b", text.lower()):
-            degrees.append("PhD")
-        if re.search(r"\b(master|msc|m\.s|ma|mba)\b", text.lower()):
-            degrees.append("Master's")
-        if re.search(r"\b(bachelor|bsc|b\.s|ba)\b", text.lower()):
-            degrees.append("Bachelor's")
-        return degrees
-
-    def _extract_certifications(self, text: str) -> List[str]:
+        return self._match_degrees(_CV_DEGREE_RE, text_lower)
+
+    def _extract_certifications(self, text_lower: str) -> List[str]:
         """Extract certifications"""
-        certs: List[str] = []
-        cert_keywords: List[str] = [
-            "aws",
-            "azure",
-            "gcp",
-            "certified",
-            "certification",
-            "cka",
-            "ckad",
-        ]
-        for cert in cert_keywords:
-            if cert in text.lower():
-                certs.append(cert)
-        return certs
+        return [cert for cert in _CV_CERT_KEYWORDS if cert in text_lower]
 
     def _extract_projects(self, text: str) -> List[str]:
         """Extract projects"""
-        project_section = re.search(
-            r"projects?:?\s*\n(.*?)(?:\n\n|\Z)", text, re.IGNORECASE | re.DOTALL
-        )
+        project_section = _PROJECTS_RE.search(text)
         if project_section:
             return [p.strip() for p in project_section.group(1).split("\n") if p.strip()][:5]
         return []
 
-    def _extract_soft_skills(self, text: str) -> List[str]:
+    def _extract_soft_skills(self, text_lower: str) -> List[str]:
         """Extract soft skills"""
-        found: List[str] = []
-        text_lower: str = text.lower()
-        soft_skills: List[str] = ["leadership", "communication", "teamwork", "problem solving"]
-        for skill in soft_skills:
-            if skill in text_lower:
-                found.append(skill)
-        return found
+        return [skill for skill in _SOFT_SKILLS if skill in text_lower]
 
     def _extract_title(self, text: str) -> str:
         """Extract job title"""
@@ -1605,39 +2062,26 @@ Best regards,
 
     def _extract_company(self, text: str) -> str:
         """Extract company name"""
-        match = re.search(r"company:\s*([^\n]+)", text, re.IGNORECASE)
+        match = _COMPANY_RE.search(text)
         return match.group(1).strip() if match else "Unknown"
 
-    def _extract_required_skills(self, text: str) -> List[str]:
+    def _extract_required_skills(self, text_lower: str) -> List[str]:
         """Extract required skills from job"""
         skills: List[str] = []
-        text_lower: str = text.lower()
-        required_section = re.search(
-            r"(?:required|must have).*?:(.*?)(?:preferred|nice to have|\Z)", text_lower, re.DOTALL
-        )
+        required_section = _REQUIRED_SECTION_RE.search(text_lower)
         search_text: str = required_section.group(1) if required_section else text_lower
 
-        all_skills: List[str] = [
-            "python",
-            "java",
-            "sql",
-            "aws",
-            "docker",
-            "kubernetes",
-            "pytorch",
-            "tensorflow",
-        ]
-        for skill in all_skills:
-            if re.search(r"\b" + skill + r"\b", search_text):
+        # One tokenizing sweep instead of a \bskill\b search per keyword
+        tokens = set(_WORD_RE.findall(search_text))
+        for skill in _REQUIRED_SKILL_KEYWORDS:
+            if skill in tokens:
                 skills.append(skill)
         return skills
 
-    def _extract_preferred_skills(self, text: str) -> List[str]:
+    def _extract_preferred_skills(self, text_lower: str) -> List[str]:
         """Extract preferred skills"""
         skills = []
-        preferred_section = re.search(
-            r"(?:preferred|nice to have).*?:(.*?)(?:\Z)", text.lower(), re.DOTALL
-        )
+        preferred_section = _PREFERRED_SECTION_RE.search(text_lower)
         if preferred_section:
             search_text = preferred_section.group(1)
             all_skills = ["python", "java", "sql", "aws", "docker"]
@@ -1646,61 +2090,52 @@ Best regards,
                     skills.append(skill)
         return skills
 
-    def _extract_required_experience(self, text: str) -> int:
+    def _extract_required_experience(self, text_lower: str) -> int:
         """Extract required experience"""
-        years = []
-        patterns = [r"(\d+)\+?\s*years?\s+(?:of\s+)?experience", r"minimum\s+(\d+)\s+years?"]
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            years.extend([int(m) for m in matches])
-        return min(years) if years else 0
-
-    def _extract_education_req(self, text: str) -> List[str]:
+        return min(
+            (
+                int(group)
+                for match in _JOB_EXPERIENCE_RE.finditer(text_lower)
+                for group in match.groups()
+                if group
+            ),
+            default=0,
+        )
+
+    def _extract_education_req(self, text_lower: str) -> List[str]:
         """Extract education requirements"""
-        reqs = []
-        text_lower = text.lower()
-        if re.search(r"\b(phd|doctorate)\b", text_lower):
-            reqs.append("PhD")
-        if re.search(r"\b(master|graduate)\b", text_lower):
-            reqs.append("Master's")
-        if re.search(r"\b(bachelor|undergraduate)\b", text_lower):
-            reqs.append("Bachelor's")
-        return reqs
-
-    def _extract_cert_req(self, text: str) -> List[str]:
+        return self._match_degrees(_JOB_DEGREE_RE, text_lower)
+
+    @staticmethod
+    def _match_degrees(pattern: re.Pattern, text_lower: str) -> List[str]:
+        """Degrees whose keywords appear in the text, highest first"""
+        found = {match.lastgroup for match in pattern.finditer(text_lower)}
+        return [degree for group, degree in _DEGREE_GROUPS if group in found]
+
+    def _extract_cert_req(self, text_lower: str) -> List[str]:
         """Extract certification requirements"""
-        certs = []
-        cert_keywords = ["aws certified", "azure certified", "cka", "ckad"]
-        for cert in cert_keywords:
-            if cert in text.lower():
-                certs.append(cert)
-        return certs
-
-    def _extract_keywords(self, text: str) -> List[str]:
+        return [cert for cert in _JOB_CERT_KEYWORDS if cert in text_lower]
+
+    def _extract_keywords(self, text_lower: str) -> List[str]:
         """Extract important keywords"""
-        keywords = []
-        important = ["machine learning", "deep learning", "mlops", "data science", "cloud"]
-        for kw in important:
-            if kw in text.lower():
-                keywords.append(kw)
-        return keywords
+        return [kw for kw in _IMPORTANT_KEYWORDS if kw in text_lower]
 
     def _extract_responsibilities(self, text: str) -> List[str]:
         """Extract job responsibilities"""
-        resp_section = re.search(
-            r"responsibilit(?:ies|y):?\s*(.*?)(?:requirements|qualifications|\Z)",
-            text,
-            re.IGNORECASE | re.DOTALL,
-        )
+        resp_section = _RESPONSIBILITIES_RE.search(text)
         if resp_section:
             return [r.strip() for r in resp_section.group(1).split("\n") if r.strip()][:5]
         return []
 
-    def _calculate_score(self, cv_data: Dict, job_data: Dict) -> Dict:
+    def _calculate_score(
+        self, cv_data: Dict, job_data: Dict, cv_flat: Optional[FrozenSet[str]] = None
+    ) -> Dict:
         """Calculate match score"""
+        if cv_flat is None:
+            cv_flat = self._flatten_skills(cv_data["skills"])
         scores = {
-            "required_skills": self._score_skills(cv_data["skills"], job_data["required_skills"]),
-            "preferred_skills": self._score_skills(cv_data["skills"], job_data["preferred_skills"]),
+            "required_skills": self._score_skills(cv_flat, job_data["required_skills"]),
+            "preferred_skills": self._score_skills(cv_flat, job_data["preferred_skills"]),
             "experience": self._score_experience(
                 cv_data["experience_years"], job_data["required_experience"]
             ),
@@ -1713,15 +2148,24 @@ Best regards,
             "keywords": self._score_keywords(cv_data.get("keywords", []), job_data["keywords"]),
         }
 
-        total = sum(scores[k] * self.WEIGHTS[k] for k in scores)
+        # self.WEIGHTS, not the module default: callers may set custom weights
+        total = sum(scores[category] * weight for category, weight in self.WEIGHTS.items())
 
-        return {"total_score": round(total, 2), "category_scores": scores, "weights": self.WEIGHTS}
+        return {
+            "total_score": round(total, 2),
+            "category_scores": scores,
+            "weights": dict(self.WEIGHTS),
+        }
 
-    def _score_skills(self, cv_skills: Dict, required: List[str]) -> float:
+    @staticmethod
+    def _flatten_skills(cv_skills: Dict[str, List[str]]) -> FrozenSet[str]:
+        """Lowercased set of every skill across categories"""
+        return frozenset(s.lower() for skills in cv_skills.values() for s in skills)
+
+    def _score_skills(self, cv_flat: FrozenSet[str], required: List[str]) -> float:
         """Score skills match"""
         if not required:
             return 100.0
-        cv_flat = [s.lower() for skills in cv_skills.values() for s in skills]
         matches = sum(1 for skill in required if skill.lower() in cv_flat)
         return (matches / len(required)) * 100
 
@@ -1737,28 +2181,30 @@ Best regards,
         """Score education match"""
         if not required:
             return 100.0
-        levels = {"Bachelor's": 1, "Master's": 2, "PhD": 3}
-        cv_level = max([levels.get(e, 0) for e in cv_edu], default=0)
-        req_level = max([levels.get(e, 0) for e in required], default=0)
-        return 100.0 if cv_level >= req_level else 70.0
+        return 100.0 if self._degree_level(cv_edu) >= self._degree_level(required) else 70.0
 
     def _score_certs(self, cv_certs: List[str], required: List[str]) -> float:
         """Score certifications match"""
         if not required:
             return 100.0
-        matches = sum(1 for cert in required if cert.lower() in [c.lower() for c in cv_certs])
+        cv_set = {c.lower() for c in cv_certs}
+        matches = sum(1 for cert in required if cert.lower() in cv_set)
         return (matches / len(required)) * 100
 
     def _score_keywords(self, cv_keywords: List[str], job_keywords: List[str]) -> float:
         """Score keywords match"""
         if not job_keywords:
             return 100.0
-        matches = sum(1 for kw in job_keywords if kw.lower() in [k.lower() for k in cv_keywords])
+        cv_set = {k.lower() for k in cv_keywords}
+        matches = sum(1 for kw in job_keywords if kw.lower() in cv_set)
         return (matches / len(job_keywords)) * 100
 
-    def _identify_gaps(self, cv_data: Dict, job_data: Dict) -> Dict:
+    def _identify_gaps(
+        self, cv_data: Dict, job_data: Dict, cv_flat: Optional[FrozenSet[str]] = None
+    ) -> Dict:
         """Identify skill gaps"""
-        cv_flat = [s.lower() for skills in cv_data["skills"].values() for s in skills]
+        if cv_flat is None:
+            cv_flat = self._flatten_skills(cv_data["skills"])
 
         return {
             "missing_required_skills": [
@@ -1777,10 +2223,14 @@ Best regards,
         """Calculate education gap"""
         if not required:
             return "None"
-        levels = {"Bachelor's": 1, "Master's": 2, "PhD": 3}
-        cv_level = max([levels.get(e, 0) for e in cv_edu], default=0)
-        req_level = max([levels.get(e, 0) for e in required], default=0)
-        return "None" if cv_level >= req_level else f"Need {required[0]}"
+        if self._degree_level(cv_edu) >= self._degree_level(required):
+            return "None"
+        return f"Need {required[0]}"
+
+    @staticmethod
+    def _degree_level(degrees: List[str]) -> int:
+        """Highest degree rank in the list (0 if none is recognised)"""
+        return max((_DEGREE_LEVELS.get(e, 0) for e in degrees), default=0)
 
     def _generate_recommendations(self, gaps: Dict, score_result: Dict) -> List[Dict]:
         """Generate recommendations"""
@@ -1849,35 +2299,20 @@ Best regards,
 
     def _generate_weekly_schedule(self, plan: Dict) -> List[Dict]:
         """Generate weekly schedule"""
-        weeks = []
-        for week in range(1, 13):
-            weeks.append(
-                {
-                    "week": week,
-                    "focus": self._get_week_focus(week, plan),
-                    "hours": 15,
-                    "activities": self._get_week_activities(week, plan),
-                }
-            )
-        return weeks
-
-    def _get_week_focus(self, week: int, plan: Dict) -> str:
-        """Get focus for specific week"""
-        if week <= 4:
-            return f"Foundation: {plan['levels']['study'][0]['skill'] if plan['levels']['study'] else 'Core skills'}"
-        elif week <= 8:
-            return "Skill Development & Practice"
-        else:
-            return "Advanced Topics & Portfolio Building"
-
-    def _get_week_activities(self, week: int, plan: Dict) -> List[str]:
-        """Get activities for specific week"""
-        if week <= 4:
-            return ["Complete foundational course", "Daily practice (1hr)", "Build mini-project"]
-        elif week <= 8:
-            return ["Advanced course modules", "Coding challenges", "Medium project"]
-        else:
-            return ["Build portfolio project", "Mock interviews", "CV updates"]
+        study: List[Dict] = plan["levels"]["study"]
+        first_skill: str = study[0]["skill"] if study else "Core skills"
+        blocks: List[Tuple[str, Tuple[str, ...]]] = [
+            (focus.format(skill=first_skill), activities) for focus, activities in _WEEK_BLOCKS
+        ]
+        return [
+            {
+                "week": week,
+                "focus": blocks[(week - 1) // _WEEKS_PER_BLOCK][0],
+                "hours": 15,
+                "activities": list(blocks[(week - 1) // _WEEKS_PER_BLOCK][1]),
+            }
+            for week in range(1, len(_WEEK_BLOCKS) * _WEEKS_PER_BLOCK + 1)
+        ]
 
     def _generate_milestones(self, plan: Dict) -> List[Dict]:
         """Generate milestones"""
@@ -1945,7 +2380,7 @@ Best regards,
 
         # Ensure all state keys exist with defaults
         state_defaults = {
-             'skills_mastered': [],
+             'skills_mastered': set(),
              'projects_completed': [],
              'tests_passed': {},
              'quality_gates_passed': [],
@@ -1954,11 +2389,13 @@ Best regards,
              'current_score': 0,
              'baseline_score': 0,
         }
+        state: Dict[str, Any] = self.state
         for key, default in state_defaults.items():
-             if key not in self.state:
-                 self.state[key] = default
+             if key not in state:
+                 state[key] = default
     
-        report = f"""
+        parts: List[str] = [
+            f"""
 {'='*100}
 COMPLETE JOB SEARCH & DEVELOPMENT REPORT
 {'='*100}
@@ -1974,11 +2411,15 @@ Overall Match Score: {analysis['score']['total_score']}%
 
 Category Breakdown:
 """
+        ]
         for category, score in analysis["score"]["category_scores"].items():
             weight = self.WEIGHTS[category]
-            report += f"  • {category.replace('_', ' ').title():<25} {score:>6.1f}% (Weight: {weight:.0%})\n"
+            parts.append(
+                f"  • {_DISPLAY_TITLES[category]:<25} {score:>6.1f}% (Weight: {weight:.0%})\n"
+            )
 
-        report += f"""
+        parts.append(
+            f"""
 Recommendation: {analysis['recommendations'][0]['action'] if analysis['recommendations'] else 'N/A'}
 
 {'='*100}
@@ -1987,42 +2428,51 @@ SECTION 2: GAP ANALYSIS
 
 Missing Required Skills ({len(analysis['gaps']['missing_required_skills'])}):
 """
-        for skill in analysis["gaps"]["missing_required_skills"][:10]:
-            report += f"  ❌ {skill}\n"
+        )
+        parts.extend(
+            f"  ❌ {skill}\n" for skill in analysis["gaps"]["missing_required_skills"][:10]
+        )
 
-        report += f"""
+        parts.append(
+            f"""
 Missing Preferred Skills ({len(analysis['gaps']['missing_preferred_skills'])}):
 """
-        for skill in analysis["gaps"]["missing_preferred_skills"][:5]:
-            report += f"  ⚠️  {skill}\n"
+        )
+        parts.extend(
+            f"  ⚠️  {skill}\n" for skill in analysis["gaps"]["missing_preferred_skills"][:5]
+        )
 
         if analysis["gaps"]["experience_gap"] > 0:
-            report += f"\nExperience Gap: {analysis['gaps']['experience_gap']} years\n"
+            parts.append(f"\nExperience Gap: {analysis['gaps']['experience_gap']} years\n")
 
-        report += f"""
+        parts.append(
+            f"""
 {'='*100}
 SECTION 3: LEARNING PLAN ({learning_plan['estimated_duration']})
 {'='*100}
 
 A) TO STUDY (New Content):
 """
+        )
         for i, item in enumerate(learning_plan["levels"]["study"], 1):
-            report += f"\n{i}. {item['skill'].upper()} [{item['priority']}]\n"
-            report += f"   Time: {item['estimated_time']}\n"
-            report += "   Resources:\n"
-            for res in item["resources"][:2]:
-                report += f"     • {res}\n"
+            parts.append(f"\n{i}. {item['skill'].upper()} [{item['priority']}]\n")
+            parts.append(f"   Time: {item['estimated_time']}\n")
+            parts.append("   Resources:\n")
+            parts.extend(f"     • {res}\n" for res in item["resources"][:2])
 
-        report += "\nB) TO PRACTICE (Strengthen Existing):\n"
+        parts.append("\nB) TO PRACTICE (Strengthen Existing):\n")
         for i, item in enumerate(learning_plan["levels"]["practice"], 1):
-            report += f"\n{i}. {item['skill']}\n"
-            report += f"   Practice: {', '.join(item['practice_activities'][:2])}\n"
+            parts.append(f"\n{i}. {item['skill']}\n")
+            parts.append(f"   Practice: {', '.join(item['practice_activities'][:2])}\n")
 
-        report += "\nC) COURSES TO TAKE:\n"
-        for i, item in enumerate(learning_plan["levels"]["courses"][:5], 1):
-            report += f"\n{i}. {item['skill']} - {item['recommended_courses'][0]}\n"
+        parts.append("\nC) COURSES TO TAKE:\n")
+        parts.extend(
+            f"\n{i}. {item['skill']} - {item['recommended_courses'][0]}\n"
+            for i, item in enumerate(learning_plan["levels"]["courses"][:5], 1)
+        )
 
-        report += f"""
+        parts.append(
+            f"""
 {'='*100}
 SECTION 4: IMPROVEMENT STRATEGY
 {'='*100}
@@ -2032,15 +2482,18 @@ Current Score: {strategy['current_score']}%
 Target Score: {strategy['target_score']}%
 
 """
+        )
         for phase in strategy["phases"]:
-            report += f"\n--- PHASE {phase['phase']}: {phase['name']} ({phase['duration']}) ---\n"
-            report += f"Focus: {phase['focus']}\n"
-            report += f"Expected Score Increase: +{phase['expected_score_increase']}%\n"
-            report += "Success Criteria:\n"
-            for criteria in phase["success_criteria"]:
-                report += f"  ✓ {criteria}\n"
-
-        report += f"""
+            parts.append(
+                f"\n--- PHASE {phase['phase']}: {phase['name']} ({phase['duration']}) ---\n"
+            )
+            parts.append(f"Focus: {phase['focus']}\n")
+            parts.append(f"Expected Score Increase: +{phase['expected_score_increase']}%\n")
+            parts.append("Success Criteria:\n")
+            parts.extend(f"  ✓ {criteria}\n" for criteria in phase["success_criteria"])
+
+        parts.append(
+            f"""
 {'='*100}
 SECTION 5: SKILL ASSESSMENT TESTS
 {'='*100}
@@ -2064,52 +2517,61 @@ SECTION 6: UPDATED SKILLSET
 
 New Skills to Add After Completion:
 """
-        all_skills = set()
-        for item in learning_plan["levels"]["study"]:
-            all_skills.add(item["skill"])
-        for item in learning_plan["levels"]["practice"]:
-            all_skills.add(item["skill"])
-
-        for skill in sorted(all_skills):
-            report += f"  + {skill}\n"
-
-        report += f"""
-Current Total Skills: {self._count_total_skills()}
-Projected Total Skills: {self._count_total_skills() + len(all_skills)}
+        )
+        all_skills = {
+            item["skill"]
+            for level in ("study", "practice")
+            for item in learning_plan["levels"][level]
+        }
+        parts.extend(f"  + {skill}\n" for skill in sorted(all_skills))
+
+        total_skills: int = self._count_total_skills()
+        parts.append(
+            f"""
+Current Total Skills: {total_skills}
+Projected Total Skills: {total_skills + len(all_skills)}
 """
+        )
 
-        if self.state.get("mode") == "reverse":
-            report += f"""
+        if state.get("mode") == "reverse":
+            skills_mastered = state["skills_mastered"]
+            projects_completed = state["projects_completed"]
+            parts.append(
+                f"""
 {'='*100}
 SECTION 6.5: REVERSE WORKFLOW PROGRESS
 {'='*100}
 
 Sprint-Based Development Status:
 
-Current Sprint: {self.state['current_sprint']}
-Total Learning Hours: {sum(s.get('total_hours', 0) for s in self.sprint_history if isinstance(s, dict) and s.get('completed'))}
+Current Sprint: {state['current_sprint']}
+Total Learning Hours: {self._completed_sprint_hours()}
 
-Skills Mastered: {len(self.state.get('skills_mastered', []))}
-→ {', '.join(self.state['skills_mastered']) if self.state['skills_mastered'] else 'None yet'}
+Skills Mastered: {len(skills_mastered)}
+→ {', '.join(sorted(skills_mastered)) if skills_mastered else 'None yet'}
 
-Projects Completed: {len(self.state['projects_completed'])}
+Projects Completed: {len(projects_completed)}
 """
-            for i, proj in enumerate(self.state["projects_completed"], 1):
-                report += f"  {i}. Sprint {proj['sprint']}: {proj['goal']}\n"
-                report += f"     URL: {proj['url']}\n"
+            )
+            for i, proj in enumerate(projects_completed, 1):
+                parts.append(f"  {i}. Sprint {proj['sprint']}: {proj['goal']}\n")
+                parts.append(f"     URL: {proj['url']}\n")
 
-            report += f"""
-Quality Gates Passed: {', '.join(self.state['quality_gates_passed']) or 'None yet'}
+            parts.append(
+                f"""
+Quality Gates Passed: {', '.join(state['quality_gates_passed']) or 'None yet'}
 
-Current Stage: {self.state['current_stage'].replace('_', ' ').title()}
+Current Stage: {state['current_stage'].replace('_', ' ').title()}
 
 Readiness Status:
-Brand Ready: {'✅' if self.state.get('brand_ready') else '⏳ In Progress'}
-Network Ready: {'✅' if self.state.get('network_ready') else '⏳ In Progress'}
-Application Ready: {'✅' if self.state.get('application_ready') else '⏳ In Progress'}
+Brand Ready: {'✅' if state.get('brand_ready') else '⏳ In Progress'}
+Network Ready: {'✅' if state.get('network_ready') else '⏳ In Progress'}
+Application Ready: {'✅' if state.get('application_ready') else '⏳ In Progress'}
 """
+            )
 
-        report += f"""
+        parts.append(
+            f"""
 {'='*100}
 SECTION 7: APPLICATION MATERIALS
 {'='*100}
@@ -2153,17 +2615,15 @@ MEDIUM-TERM (Weeks 9-12):
 REPORT END
 {'='*100}
 """
-        return report
+        )
+        return "".join(parts)
 
     def export_all(self, job_id: str) -> str:
         """Export all data for a job analysis"""
         export_dir = self.data_dir / f"export_{job_id}"
         export_dir.mkdir(exist_ok=True)
 
-        analysis = next(
-        (a for a in self.analyzed_jobs if isinstance(a, dict) and a.get("job_id") == job_id), 
-        None
-        )
+        analysis = self._analyses_by_id.get(job_id)
         if not analysis:
             return "Job analysis not found"
 
@@ -2202,6 +2662,38 @@ REPORT END
         return f"✅ Exported {len(files_created)} files to {export_dir}"
 
 
+# ========== BATCH WORKERS ==========
+# Module level so ProcessPoolExecutor can pickle them by reference
+
+_batch_engine: Optional[AdvancedJobEngine] = None
+_batch_cv_text: str = ""
+
+
+def _init_batch_worker(data_dir: str, cv_text: str, weights: Dict[str, float]) -> None:
+    """Create the worker's engine once and warm its parse cache with the CV"""
+    global _batch_engine, _batch_cv_text
+    _batch_engine = AdvancedJobEngine(data_dir=data_dir)
+    # Score with the parent engine's (possibly customised) weights
+    _batch_engine.WEIGHTS = weights
+    _batch_cv_text = cv_text
+    _batch_engine.parse_cv(cv_text)
+
+
+def _analyze_in_worker(job: Tuple[str, str, str]) -> Dict[str, Any]:
+    """Analyze one (job_text, job_title, company) against the worker's CV"""
+    assert _batch_engine is not None
+    return _batch_engine._build_analysis(_batch_cv_text, *job)
+
+
+def _read_pasted_text() -> str:
+    """Read pasted text from stdin up to EOF (Ctrl+D / Ctrl+Z)"""
+    # One buffered read instead of an input() call and a list entry per line;
+    # the final newline is dropped, as joining input() lines would
+    sys.stdout.flush()
+    text: str = sys.stdin.read()
+    return text[:-1] if text.endswith("\n") else text
+
+
 def main():
     """Interactive CLI for Advanced Job Engine"""
     print("\n" + "=" * 100)
@@ -2373,24 +2865,10 @@ Skills:
     if choice == "1":
         print("\n--- Analyze Your CV and Job (Text Input) ---")
         print("\nPaste your CV (press Ctrl+D or Ctrl+Z on new line when done):")
-        cv_lines = []
-        try:
-            while True:
-                line = input()
-                cv_lines.append(line)
-        except EOFError:
-            pass
-        user_cv = "\n".join(cv_lines)
+        user_cv = _read_pasted_text()
 
         print("\nPaste job description (press Ctrl+D or Ctrl+Z on new line when done):")
-        job_lines = []
-        try:
-            while True:
-                line = input()
-                job_lines.append(line)
-        except EOFError:
-            pass
-        user_job = "\n".join(job_lines)
+        user_job = _read_pasted_text()
 
         job_title = input("\nJob title: ")
         company = input("Company name: ")